@@ -13,6 +13,9 @@ from typing import List, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class DatabaseConfig:
@@ -62,7 +65,7 @@ class TimelineConfig:
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
 
         with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         # Parse database config
         db_config = DatabaseConfig(**data.get("database", {}))
@@ -110,6 +113,16 @@ def get_config(config_path: Optional[Path] = None) -> TimelineConfig:
     return _config
 
 
+def set_config(config: TimelineConfig) -> None:
+    """
+    Install a configuration as the global instance (useful for testing).
+
+    :param config: TimelineConfig to return from subsequent get_config() calls
+    """
+    global _config
+    _config = config
+
+
 def reset_config() -> None:
     """Reset the global configuration (useful for testing)."""
     global _config
@@ -4,7 +4,13 @@ app_timeline.db
 Database connection and schema management utilities.
 """
 
-from .connection import get_engine, get_session, init_db, reset_engine
+from .connection import (
+    create_db_engine,
+    get_engine,
+    get_session,
+    init_db,
+    reset_engine,
+)
 from .schema import (
     create_all_tables,
     drop_all_tables,
@@ -14,6 +20,7 @@ from .schema import (
 )
 
 __all__ = [
+    "create_db_engine",
     "get_engine",
     "get_session",
     "init_db",
@@ -12,8 +12,9 @@ from typing import Optional
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from ..config import get_config
+from ..config import DatabaseConfig, get_config
 
 # Global engine instance
 _engine: Optional[Engine] = None
@@ -30,18 +31,40 @@ def get_engine(echo: Optional[bool] = None) -> Engine:
     global _engine
 
     if _engine is None:
-        config = get_config()
-        connection_string = config.database.connection_string
-        echo_sql = echo if echo is not None else config.database.echo
+        _engine = create_db_engine(get_config().database, echo=echo)
 
+    return _engine
+
+
+def create_db_engine(database: DatabaseConfig, echo: Optional[bool] = None) -> Engine:
+    """
+    Create a new SQLAlchemy engine for a database configuration.
+
+    A SQLite path of ``:memory:`` yields a single shared in-memory database
+    (one connection reused via ``StaticPool``).
+
+    :param database: Database configuration to connect to
+    :param echo: Optional override for SQL echo setting
+    :return: SQLAlchemy Engine instance
+    """
+    echo_sql = echo if echo is not None else database.echo
+
+    if database.dialect == "sqlite" and database.path == ":memory:":
+        engine = create_engine(
+            database.connection_string,
+            echo=echo_sql,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
         # Ensure database directory exists
-        if config.database.dialect == "sqlite":
-            db_path = Path(config.database.path)
+        if database.dialect == "sqlite":
+            db_path = Path(database.path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        _engine = create_engine(connection_string, echo=echo_sql)
+        engine = create_engine(database.connection_string, echo=echo_sql)
 
-    return _engine
+    return engine
 
 
 def get_session_factory() -> sessionmaker:
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from sqlalchemy import inspect
+from sqlalchemy import func, inspect, select
 
 from ..models import Base
 from .connection import get_engine, get_session
@@ -57,6 +57,8 @@ def get_table_row_counts() -> Dict[str, int]:
     """
     Get row counts for all tables.
 
+    All tables are counted in a single SELECT of per-table count subqueries.
+
     :return: Dictionary with table names as keys and row counts as values
     """
     from ..models import (
@@ -72,24 +74,35 @@ def get_table_row_counts() -> Dict[str, int]:
         SettlementSnapshot,
     )
 
-    session = get_session()
-    counts = {}
+    models = (
+        Epoch,
+        Region,
+        RegionSnapshot,
+        Province,
+        ProvinceSnapshot,
+        Settlement,
+        SettlementSnapshot,
+        Route,
+        Entity,
+        Event,
+    )
+    stmt = select(
+        *(
+            select(func.count())
+            .select_from(model)
+            .scalar_subquery()
+            .label(model.__tablename__)
+            for model in models
+        )
+    )
 
+    session = get_session()
     try:
-        counts["epochs"] = session.query(Epoch).count()
-        counts["regions"] = session.query(Region).count()
-        counts["region_snapshots"] = session.query(RegionSnapshot).count()
-        counts["provinces"] = session.query(Province).count()
-        counts["province_snapshots"] = session.query(ProvinceSnapshot).count()
-        counts["settlements"] = session.query(Settlement).count()
-        counts["settlement_snapshots"] = session.query(SettlementSnapshot).count()
-        counts["routes"] = session.query(Route).count()
-        counts["entities"] = session.query(Entity).count()
-        counts["events"] = session.query(Event).count()
+        row = session.execute(stmt).one()
     finally:
         session.close()
 
-    return counts
+    return dict(row._mapping)
 
 
 def validate_schema() -> List[str]:
@@ -9,12 +9,17 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy import Column, DateTime, Integer, JSON
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import declarative_base
 
 # Create the declarative base for all models
 Base = declarative_base()
 
+# Column type for MetadataMixin.meta_data: in-place dict changes are tracked,
+# so they are flushed without calling flag_modified()
+MetadataJSON = MutableDict.as_mutable(JSON)
+
 
 class TimestampMixin:
     """
@@ -82,6 +87,8 @@ class MetadataMixin:
 
     Enforces flat key-value structure for metadata (no nesting/arrays).
     Provides operations: merge, remove, replace, clear.
+
+    Models using this mixin declare meta_data as a MetadataJSON column.
     """
 
     @staticmethod
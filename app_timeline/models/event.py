@@ -6,7 +6,8 @@ Event model for timeline events.
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, CheckConstraint, Column, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Boolean, CheckConstraint, Column, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import relationship
 
 from .base import Base, PrimaryKeyMixin, TimestampMixin
 
@@ -31,6 +32,10 @@ class Event(Base, PrimaryKeyMixin, TimestampMixin):
             "CASE WHEN settlement_id IS NOT NULL THEN 1 ELSE 0 END) = 1",
             name="event_location_exclusivity"
         ),
+        # Per-location lookups filter on the location and sort by day
+        Index("ix_events_region_day", "region_id", "astro_day"),
+        Index("ix_events_province_day", "province_id", "astro_day"),
+        Index("ix_events_settlement_day", "settlement_id", "astro_day"),
     )
 
     # When the event occurred (lore time)
@@ -66,6 +71,11 @@ class Event(Base, PrimaryKeyMixin, TimestampMixin):
     # Example: {"tags": ["battle", "political"], "source": "Chapter 12", "importance": "high"}
     meta_data = Column(JSON, nullable=True)
 
+    # Relationships
+    superseded_by = relationship(
+        "Event", remote_side="Event.id", foreign_keys=[superseded_by_id]
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Event(id={self.id}, astro_day={self.astro_day}, "
@@ -6,12 +6,13 @@ Province and Region models.
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from .base import (
     Base,
     DescriptionMixin,
+    MetadataJSON,
     MetadataMixin,
     PrimaryKeyMixin,
     TemporalBoundsMixin,
@@ -43,7 +44,7 @@ class Region(
 
     # Flexible metadata (geographic features, cultural notes, etc.)
     # ADR-008: Use DescriptionMixin/MetadataMixin for programmatic access
-    meta_data = Column(JSON, nullable=True)
+    meta_data = Column(MetadataJSON, nullable=True)
 
     # Relationships
     provinces = relationship(
@@ -83,7 +84,7 @@ class Province(
     # Flexible metadata (borders, capital settlement, cultural notes, etc.)
     # Example: {"capital": "Ingar", "ring_towns": ["Ingar", "Talmar"]}
     # ADR-008: Use DescriptionMixin/MetadataMixin for programmatic access
-    meta_data = Column(JSON, nullable=True)
+    meta_data = Column(MetadataJSON, nullable=True)
 
     # Relationships
     region = relationship("Region", back_populates="provinces")
@@ -7,10 +7,10 @@ PR-003a: Macro-scale simulation support.
 
 from __future__ import annotations
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, JSON, String
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, JSON, String
 from sqlalchemy.orm import relationship
 
-from .base import Base, MetadataMixin, PrimaryKeyMixin, TimestampMixin
+from .base import Base, MetadataJSON, MetadataMixin, PrimaryKeyMixin, TimestampMixin
 
 
 class ProvinceSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
@@ -58,7 +58,7 @@ class ProvinceSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
 
     # Flexible metadata for additional snapshot-specific data
     # ADR-008: Use MetadataMixin for programmatic access
-    meta_data = Column(JSON, nullable=True)
+    meta_data = Column(MetadataJSON, nullable=True)
 
     # Relationships
     province = relationship("Province", back_populates="snapshots")
@@ -72,6 +72,8 @@ class ProvinceSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
         CheckConstraint(
             "astro_day >= 0", name="check_province_snapshot_astro_day_nonnegative"
         ),
+        # Serves at-day, nearest and range lookups for one province
+        Index("ix_province_snapshots_province_day", "province_id", "astro_day"),
     )
 
     def __repr__(self) -> str:
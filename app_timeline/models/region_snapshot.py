@@ -7,10 +7,10 @@ PR-003a: Macro-scale simulation support.
 
 from __future__ import annotations
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, JSON, String
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, JSON, String
 from sqlalchemy.orm import relationship
 
-from .base import Base, MetadataMixin, PrimaryKeyMixin, TimestampMixin
+from .base import Base, MetadataJSON, MetadataMixin, PrimaryKeyMixin, TimestampMixin
 
 
 class RegionSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
@@ -56,7 +56,7 @@ class RegionSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
 
     # Flexible metadata for additional snapshot-specific data
     # ADR-008: Use MetadataMixin for programmatic access
-    meta_data = Column(JSON, nullable=True)
+    meta_data = Column(MetadataJSON, nullable=True)
 
     # Relationships
     region = relationship("Region", back_populates="snapshots")
@@ -70,6 +70,8 @@ class RegionSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
         CheckConstraint(
             "astro_day >= 0", name="check_region_snapshot_astro_day_nonnegative"
         ),
+        # Serves at-day, nearest and range lookups for one region
+        Index("ix_region_snapshots_region_day", "region_id", "astro_day"),
     )
 
     def __repr__(self) -> str:
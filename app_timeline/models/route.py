@@ -6,7 +6,8 @@ Route model for connections between settlements.
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, JSON, String
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, JSON, String
+from sqlalchemy.orm import relationship
 
 from .base import Base, PrimaryKeyMixin, TemporalBoundsMixin, TimestampMixin
 
@@ -19,6 +20,15 @@ class Route(Base, PrimaryKeyMixin, TemporalBoundsMixin, TimestampMixin):
 
     __tablename__ = "routes"
 
+    # Lets get_route_between_settlements resolve both endpoints in one probe
+    __table_args__ = (
+        Index(
+            "ix_routes_origin_destination",
+            "origin_settlement_id",
+            "destination_settlement_id",
+        ),
+    )
+
     # Route endpoints
     origin_settlement_id = Column(
         Integer, ForeignKey("settlements.id"), nullable=False, index=True
@@ -43,6 +53,12 @@ class Route(Base, PrimaryKeyMixin, TemporalBoundsMixin, TimestampMixin):
     # Example: {"terrain": "mountain pass", "seasonal_access": "spring-fall", "hazards": ["bandits"]}
     meta_data = Column(JSON, nullable=True)
 
+    # Relationships
+    origin_settlement = relationship("Settlement", foreign_keys=[origin_settlement_id])
+    destination_settlement = relationship(
+        "Settlement", foreign_keys=[destination_settlement_id]
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Route(id={self.id}, origin_id={self.origin_settlement_id}, "
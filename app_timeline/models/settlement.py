@@ -6,11 +6,12 @@ Settlement and SettlementSnapshot models.
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, JSON, String
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, JSON, String
 from sqlalchemy.orm import relationship
 
 from .base import (
     Base,
+    MetadataJSON,
     MetadataMixin,
     PrimaryKeyMixin,
     TemporalBoundsMixin,
@@ -87,6 +88,11 @@ class SettlementSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
 
     __tablename__ = "settlement_snapshots"
 
+    # Serves per-settlement day lookups and ranges (get_snapshots_in_range)
+    __table_args__ = (
+        Index("ix_settlement_snapshots_settlement_day", "settlement_id", "astro_day"),
+    )
+
     # Which settlement this snapshot describes
     settlement_id = Column(
         Integer, ForeignKey("settlements.id"), nullable=False, index=True
@@ -119,7 +125,7 @@ class SettlementSnapshot(Base, PrimaryKeyMixin, TimestampMixin, MetadataMixin):
     economic_data = Column(JSON, nullable=True)
 
     # Flexible metadata for additional snapshot-specific data
-    meta_data = Column(JSON, nullable=True)
+    meta_data = Column(MetadataJSON, nullable=True)
 
     # Relationships
     settlement = relationship("Settlement", back_populates="snapshots")
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from ..db.connection import get_session
@@ -17,13 +18,16 @@ from ..models.base import Base
 # Type variable for model classes
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
 
 class BaseService(Generic[ModelType]):
     """
     Base service class for CRUD operations.
 
     Provides common patterns for:
-    - Creating records
+    - Creating records (singly, in bulk, or skipping unique conflicts)
     - Retrieving by ID or name
     - Listing with filters
     - Updating records
@@ -32,14 +36,16 @@ class BaseService(Generic[ModelType]):
     Each model-specific service should inherit from this class.
     """
 
-    def __init__(self, model_class: Type[ModelType]):
+    def __init__(self, model_class: Type[ModelType], session: Optional[Session] = None):
         """
         Initialize the service with a specific model class.
 
         :param model_class: SQLAlchemy model class (e.g., Epoch, Settlement)
+        :param session: Existing session to share; it is left open on close()
         """
         self.model_class = model_class
-        self._session: Optional[Session] = None
+        self._session: Optional[Session] = session
+        self._owns_session = session is None
 
     @property
     def session(self) -> Session:
@@ -49,8 +55,8 @@ class BaseService(Generic[ModelType]):
         return self._session
 
     def close(self) -> None:
-        """Close the database session."""
-        if self._session is not None:
+        """Close the database session, unless it was shared with this service."""
+        if self._session is not None and self._owns_session:
             self._session.close()
             self._session = None
 
@@ -80,6 +86,64 @@ class BaseService(Generic[ModelType]):
             self.session.rollback()
             raise ValueError(f"Failed to create {self.model_class.__name__}: {e}")
 
+    def create_unique(
+        self, conflict_columns: List[str], **kwargs
+    ) -> Optional[ModelType]:
+        """
+        Create a new record unless it would violate a unique constraint.
+
+        Uses a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` statement
+        instead of checking for an existing row first.
+
+        :param conflict_columns: Columns of the unique constraint to check
+        :param kwargs: Field values for the new record
+        :return: Created model instance, or None if a conflicting row exists
+        :raises ValueError: If creation fails for any other reason
+        """
+        try:
+            dialect = self.session.get_bind().dialect.name
+            stmt = (
+                _UPSERT_INSERTS[dialect](self.model_class)
+                .values(**kwargs)
+                .on_conflict_do_nothing(index_elements=conflict_columns)
+                .returning(self.model_class)
+            )
+            instance = self.session.scalars(stmt).one_or_none()
+            self.session.commit()
+            if instance is not None:
+                self.session.refresh(instance)
+            return instance
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(f"Failed to create {self.model_class.__name__}: {e}")
+
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        Create several records with a single INSERT statement.
+
+        Unlike the model-specific create methods, this runs no per-row
+        validation or uniqueness checks; rows must already be valid.
+
+        :param rows: Field values for each new record
+        :return: Created model instances, in the order of ``rows``
+        :raises ValueError: If the insert fails
+        """
+        if not rows:
+            return []
+
+        try:
+            stmt = insert(self.model_class).returning(
+                self.model_class, sort_by_parameter_order=True
+            )
+            instances = list(self.session.scalars(stmt, rows).all())
+            self.session.commit()
+            return instances
+        except Exception as e:
+            self.session.rollback()
+            raise ValueError(
+                f"Failed to create {self.model_class.__name__} records: {e}"
+            )
+
     def get_by_id(self, record_id: int) -> Optional[ModelType]:
         """
         Retrieve a record by its primary key ID.
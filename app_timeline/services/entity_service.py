@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.entity import Entity
 from .base import BaseService
@@ -22,9 +23,13 @@ class EntityService(BaseService[Entity]):
     Provides CRUD operations plus entity-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the entity service."""
-        super().__init__(Entity)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the entity service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Entity, session=session)
 
     def create_entity(
         self,
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.epoch import Epoch
 from .base import BaseService
@@ -24,9 +25,13 @@ class EpochService(BaseService[Epoch]):
     - Listing epochs by time range
     """
 
-    def __init__(self):
-        """Initialize the epoch service."""
-        super().__init__(Epoch)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the epoch service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Epoch, session=session)
 
     def get_epochs_containing_day(self, astro_day: int) -> List[Epoch]:
         """
@@ -124,17 +129,19 @@ class EpochService(BaseService[Epoch]):
                 f"end_astro_day ({end_astro_day}) must be >= start_astro_day ({start_astro_day})"
             )
 
-        # Check for duplicate name
-        existing = self.get_by_name(name)
-        if existing is not None:
-            raise ValueError(
-                f"Epoch with name '{name}' already exists (ID: {existing.id})"
-            )
-
-        return self.create(
+        # Insert, skipping the row if the name is already taken
+        epoch = self.create_unique(
+            ["name"],
             name=name,
             start_astro_day=start_astro_day,
             end_astro_day=end_astro_day,
             description=description,
             meta_data=meta_data,
         )
+        if epoch is None:
+            existing = self.get_by_name(name)
+            raise ValueError(
+                f"Epoch with name '{name}' already exists (ID: {existing.id})"
+            )
+
+        return epoch
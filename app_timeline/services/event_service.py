@@ -9,7 +9,9 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
+from ..models.epoch import Epoch
 from ..models.event import Event
 from .base import BaseService
 
@@ -22,9 +24,13 @@ class EventService(BaseService[Event]):
     Provides CRUD operations plus event-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the event service."""
-        super().__init__(Event)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the event service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Event, session=session)
 
     def create_event(
         self,
@@ -74,7 +80,7 @@ class EventService(BaseService[Event]):
         if region_id is not None:
             from .region_service import RegionService
 
-            with RegionService() as region_service:
+            with RegionService(session=self.session) as region_service:
                 region = region_service.get_by_id(region_id)
                 if region is None:
                     raise ValueError(f"Region with ID {region_id} does not exist")
@@ -83,7 +89,7 @@ class EventService(BaseService[Event]):
         if province_id is not None:
             from .province_service import ProvinceService
 
-            with ProvinceService() as province_service:
+            with ProvinceService(session=self.session) as province_service:
                 province = province_service.get_by_id(province_id)
                 if province is None:
                     raise ValueError(f"Province with ID {province_id} does not exist")
@@ -92,7 +98,7 @@ class EventService(BaseService[Event]):
         if settlement_id is not None:
             from .settlement_service import SettlementService
 
-            with SettlementService() as settlement_service:
+            with SettlementService(session=self.session) as settlement_service:
                 settlement = settlement_service.get_by_id(settlement_id)
                 if settlement is None:
                     raise ValueError(
@@ -103,7 +109,7 @@ class EventService(BaseService[Event]):
         if entity_id is not None:
             from .entity_service import EntityService
 
-            with EntityService() as entity_service:
+            with EntityService(session=self.session) as entity_service:
                 entity = entity_service.get_by_id(entity_id)
                 if entity is None:
                     raise ValueError(f"Entity with ID {entity_id} does not exist")
@@ -268,14 +274,27 @@ class EventService(BaseService[Event]):
         :param epoch_id: ID of the epoch
         :param active_only: If True, only return active events
         :return: List of events during the epoch
+        :raises ValueError: If the epoch does not exist
         """
-        from .epoch_service import EpochService
+        # Join on the epoch's day range so the lookup is a single query
+        stmt = (
+            select(Event)
+            .join(
+                Epoch,
+                Event.astro_day.between(Epoch.start_astro_day, Epoch.end_astro_day),
+            )
+            .where(Epoch.id == epoch_id)
+            .order_by(Event.astro_day, Event.title)
+        )
 
-        with EpochService() as epoch_service:
-            epoch = epoch_service.get_by_id(epoch_id)
-            if epoch is None:
-                raise ValueError(f"Epoch with ID {epoch_id} does not exist")
+        if active_only:
+            stmt = stmt.where(Event.is_deprecated == False)
 
-            return self.get_events_in_range(
-                epoch.start_astro_day, epoch.end_astro_day, active_only=active_only
-            )
+        result = self.session.execute(stmt)
+        events = list(result.scalars().all())
+
+        # An empty result may mean the epoch itself is missing
+        if not events and self.session.get(Epoch, epoch_id) is None:
+            raise ValueError(f"Epoch with ID {epoch_id} does not exist")
+
+        return events
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.province import Province
 from .base import BaseService
@@ -22,9 +23,13 @@ class ProvinceService(BaseService[Province]):
     Provides CRUD operations plus province-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the province service."""
-        super().__init__(Province)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the province service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Province, session=session)
 
     def create_province(
         self,
@@ -54,7 +59,7 @@ class ProvinceService(BaseService[Province]):
         if region_id is not None:
             from .region_service import RegionService
 
-            with RegionService() as region_service:
+            with RegionService(session=self.session) as region_service:
                 region = region_service.get_by_id(region_id)
                 if region is None:
                     raise ValueError(f"Region with ID {region_id} does not exist")
@@ -7,9 +7,10 @@ PR-003a: Macro-scale simulation infrastructure.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
 
 from ..models.province_snapshot import ProvinceSnapshot
 from .base import BaseService
@@ -28,9 +29,26 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
     PR-003a: Supports macro-scale demographic simulation.
     """
 
-    def __init__(self):
-        """Initialize the province snapshot service."""
-        super().__init__(ProvinceSnapshot)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the province snapshot service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(ProvinceSnapshot, session=session)
+        # Province IDs already confirmed to exist in this session. Assumes a province
+        # is not deleted while the service is open; the set is cleared
+        # whenever the session rolls back, since that may undo the province.
+        self._known_provinces: Set[int] = set()
+
+    def close(self) -> None:
+        """Close the database session and forget confirmed provinces."""
+        if self._session is not None and event.contains(
+            self._session, "after_soft_rollback", self._forget_provinces
+        ):
+            event.remove(self._session, "after_soft_rollback", self._forget_provinces)
+        super().close()
+        self._known_provinces.clear()
 
     def create_snapshot(
         self,
@@ -62,12 +80,7 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
         :raises ValueError: If validation fails
         """
         # Validate province exists
-        from .province_service import ProvinceService
-
-        with ProvinceService() as province_service:
-            province = province_service.get_by_id(province_id)
-            if province is None:
-                raise ValueError(f"Province with ID {province_id} does not exist")
+        self._require_province(province_id)
 
         # Validate astro_day and population
         if astro_day < 0:
@@ -96,6 +109,57 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
             meta_data=meta_data,
         )
 
+    def bulk_create_snapshots(
+        self, province_id: int, rows: List[Dict[str, Any]]
+    ) -> List[ProvinceSnapshot]:
+        """
+        Create several snapshots for one province with a single INSERT.
+
+        The province is looked up once and existing days are checked with one
+        query, instead of once per snapshot as with create_snapshot.
+
+        :param province_id: ID of the province
+        :param rows: Snapshot fields for each day, as for create_snapshot but
+            without province_id
+        :return: Created snapshots, in the order of ``rows``
+        :raises ValueError: If validation fails
+        """
+        # Validate province exists
+        self._require_province(province_id)
+
+        # Validate astro_day and population, collecting repeated days
+        days = set()
+        duplicates = set()
+        for index, row in enumerate(rows):
+            for key in ("astro_day", "population_total"):
+                if key not in row:
+                    raise ValueError(f"Row {index} missing {key}")
+            if "province_id" in row:
+                raise ValueError(f"Row {index} must not set province_id")
+            if row["astro_day"] < 0:
+                raise ValueError(f"astro_day must be >= 0, got {row['astro_day']}")
+            if row["population_total"] < 0:
+                raise ValueError(
+                    f"population_total must be >= 0, got {row['population_total']}"
+                )
+            if row["astro_day"] in days:
+                duplicates.add(row["astro_day"])
+            days.add(row["astro_day"])
+
+        # Check for days that already have a snapshot
+        stmt = select(ProvinceSnapshot.astro_day).where(
+            ProvinceSnapshot.province_id == province_id,
+            ProvinceSnapshot.astro_day.in_(days),
+        )
+        duplicates.update(self.session.scalars(stmt))
+        if duplicates:
+            raise ValueError(
+                f"Snapshot already exists for province {province_id} "
+                f"at day(s) {sorted(duplicates)}"
+            )
+
+        return self.bulk_create([{**row, "province_id": province_id} for row in rows])
+
     def get_snapshots_for_province(
         self,
         province_id: int,
@@ -131,6 +195,33 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
 
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_snapshot_days_for_province(
+        self,
+        province_id: int,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Get the days that have snapshots for a province, without loading the rows.
+
+        :param province_id: ID of the province
+        :param start_day: Optional start day filter
+        :param end_day: Optional end day filter
+        :return: List of astro_day values in ascending order
+        """
+        stmt = select(ProvinceSnapshot.astro_day).where(
+            ProvinceSnapshot.province_id == province_id
+        )
+
+        if start_day is not None:
+            stmt = stmt.where(ProvinceSnapshot.astro_day >= start_day)
+        if end_day is not None:
+            stmt = stmt.where(ProvinceSnapshot.astro_day <= end_day)
+
+        stmt = stmt.order_by(ProvinceSnapshot.astro_day)
+
+        return list(self.session.execute(stmt).scalars().all())
+
     def get_snapshot_at_day(
         self, province_id: int, astro_day: int
     ) -> Optional[ProvinceSnapshot]:
@@ -169,7 +260,7 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
             stmt = stmt.where(ProvinceSnapshot.astro_day >= astro_day)
             stmt = stmt.order_by(ProvinceSnapshot.astro_day.asc())
 
-        return self.session.execute(stmt).scalars().first()
+        return self.session.execute(stmt.limit(1)).scalars().first()
 
     def get_interpolated(
         self, province_id: int, astro_day: int
@@ -247,6 +338,32 @@ class ProvinceSnapshotService(BaseService[ProvinceSnapshot]):
 
     # Helper methods
 
+    def _require_province(self, province_id: int) -> None:
+        """
+        Check that a province exists, querying at most once per ID.
+
+        :param province_id: ID of the province
+        :raises ValueError: If the province does not exist
+        """
+        if province_id in self._known_provinces:
+            return
+
+        from .province_service import ProvinceService
+
+        with ProvinceService(session=self.session) as province_service:
+            if province_service.get_by_id(province_id) is None:
+                raise ValueError(f"Province with ID {province_id} does not exist")
+
+        if not event.contains(
+            self.session, "after_soft_rollback", self._forget_provinces
+        ):
+            event.listen(self.session, "after_soft_rollback", self._forget_provinces)
+        self._known_provinces.add(province_id)
+
+    def _forget_provinces(self, session: Session, previous_transaction) -> None:
+        """Drop confirmed province IDs after a rollback (session event hook)."""
+        self._known_provinces.clear()
+
     def _snapshot_to_dict(self, snapshot: ProvinceSnapshot) -> Dict[str, Any]:
         """Convert snapshot to dictionary."""
         return {
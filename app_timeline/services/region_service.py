@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy.orm import Session
+
 from ..models.province import Region
 from .base import BaseService
 
@@ -20,9 +22,13 @@ class RegionService(BaseService[Region]):
     Provides CRUD operations for region management.
     """
 
-    def __init__(self):
-        """Initialize the region service."""
-        super().__init__(Region)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the region service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Region, session=session)
 
     def create_region(
         self,
@@ -39,14 +45,17 @@ class RegionService(BaseService[Region]):
         :return: Created region
         :raises ValueError: If validation fails
         """
-        # Check for duplicate name
-        existing = self.get_by_name(name)
-        if existing is not None:
+        # Insert, skipping the row if the name is already taken
+        region = self.create_unique(
+            ["name"], name=name, description=description, meta_data=meta_data
+        )
+        if region is None:
+            existing = self.get_by_name(name)
             raise ValueError(
                 f"Region with name '{name}' already exists (ID: {existing.id})"
             )
 
-        return self.create(name=name, description=description, meta_data=meta_data)
+        return region
 
     def get_active_regions(self):
         """
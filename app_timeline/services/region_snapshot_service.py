@@ -7,9 +7,10 @@ PR-003a: Macro-scale simulation infrastructure.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
 
 from ..models.region_snapshot import RegionSnapshot
 from .base import BaseService
@@ -28,9 +29,26 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
     PR-003a: Supports macro-scale demographic simulation.
     """
 
-    def __init__(self):
-        """Initialize the region snapshot service."""
-        super().__init__(RegionSnapshot)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the region snapshot service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(RegionSnapshot, session=session)
+        # Region IDs already confirmed to exist in this session. Assumes a region
+        # is not deleted while the service is open; the set is cleared
+        # whenever the session rolls back, since that may undo the region.
+        self._known_regions: Set[int] = set()
+
+    def close(self) -> None:
+        """Close the database session and forget confirmed regions."""
+        if self._session is not None and event.contains(
+            self._session, "after_soft_rollback", self._forget_regions
+        ):
+            event.remove(self._session, "after_soft_rollback", self._forget_regions)
+        super().close()
+        self._known_regions.clear()
 
     def create_snapshot(
         self,
@@ -62,12 +80,7 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
         :raises ValueError: If validation fails
         """
         # Validate region exists
-        from .region_service import RegionService
-
-        with RegionService() as region_service:
-            region = region_service.get_by_id(region_id)
-            if region is None:
-                raise ValueError(f"Region with ID {region_id} does not exist")
+        self._require_region(region_id)
 
         # Validate astro_day and population
         if astro_day < 0:
@@ -96,6 +109,57 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
             meta_data=meta_data,
         )
 
+    def bulk_create_snapshots(
+        self, region_id: int, rows: List[Dict[str, Any]]
+    ) -> List[RegionSnapshot]:
+        """
+        Create several snapshots for one region with a single INSERT.
+
+        The region is looked up once and existing days are checked with one
+        query, instead of once per snapshot as with create_snapshot.
+
+        :param region_id: ID of the region
+        :param rows: Snapshot fields for each day, as for create_snapshot but
+            without region_id
+        :return: Created snapshots, in the order of ``rows``
+        :raises ValueError: If validation fails
+        """
+        # Validate region exists
+        self._require_region(region_id)
+
+        # Validate astro_day and population, collecting repeated days
+        days = set()
+        duplicates = set()
+        for index, row in enumerate(rows):
+            for key in ("astro_day", "population_total"):
+                if key not in row:
+                    raise ValueError(f"Row {index} missing {key}")
+            if "region_id" in row:
+                raise ValueError(f"Row {index} must not set region_id")
+            if row["astro_day"] < 0:
+                raise ValueError(f"astro_day must be >= 0, got {row['astro_day']}")
+            if row["population_total"] < 0:
+                raise ValueError(
+                    f"population_total must be >= 0, got {row['population_total']}"
+                )
+            if row["astro_day"] in days:
+                duplicates.add(row["astro_day"])
+            days.add(row["astro_day"])
+
+        # Check for days that already have a snapshot
+        stmt = select(RegionSnapshot.astro_day).where(
+            RegionSnapshot.region_id == region_id,
+            RegionSnapshot.astro_day.in_(days),
+        )
+        duplicates.update(self.session.scalars(stmt))
+        if duplicates:
+            raise ValueError(
+                f"Snapshot already exists for region {region_id} "
+                f"at day(s) {sorted(duplicates)}"
+            )
+
+        return self.bulk_create([{**row, "region_id": region_id} for row in rows])
+
     def get_snapshots_for_region(
         self,
         region_id: int,
@@ -129,6 +193,33 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
 
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_snapshot_days_for_region(
+        self,
+        region_id: int,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Get the days that have snapshots for a region, without loading the rows.
+
+        :param region_id: ID of the region
+        :param start_day: Optional start day filter
+        :param end_day: Optional end day filter
+        :return: List of astro_day values in ascending order
+        """
+        stmt = select(RegionSnapshot.astro_day).where(
+            RegionSnapshot.region_id == region_id
+        )
+
+        if start_day is not None:
+            stmt = stmt.where(RegionSnapshot.astro_day >= start_day)
+        if end_day is not None:
+            stmt = stmt.where(RegionSnapshot.astro_day <= end_day)
+
+        stmt = stmt.order_by(RegionSnapshot.astro_day)
+
+        return list(self.session.execute(stmt).scalars().all())
+
     def get_snapshot_at_day(
         self, region_id: int, astro_day: int
     ) -> Optional[RegionSnapshot]:
@@ -165,7 +256,7 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
             stmt = stmt.where(RegionSnapshot.astro_day >= astro_day)
             stmt = stmt.order_by(RegionSnapshot.astro_day.asc())
 
-        return self.session.execute(stmt).scalars().first()
+        return self.session.execute(stmt.limit(1)).scalars().first()
 
     def get_interpolated(
         self, region_id: int, astro_day: int
@@ -243,6 +334,32 @@ class RegionSnapshotService(BaseService[RegionSnapshot]):
 
     # Helper methods
 
+    def _require_region(self, region_id: int) -> None:
+        """
+        Check that a region exists, querying at most once per ID.
+
+        :param region_id: ID of the region
+        :raises ValueError: If the region does not exist
+        """
+        if region_id in self._known_regions:
+            return
+
+        from .region_service import RegionService
+
+        with RegionService(session=self.session) as region_service:
+            if region_service.get_by_id(region_id) is None:
+                raise ValueError(f"Region with ID {region_id} does not exist")
+
+        if not event.contains(
+            self.session, "after_soft_rollback", self._forget_regions
+        ):
+            event.listen(self.session, "after_soft_rollback", self._forget_regions)
+        self._known_regions.add(region_id)
+
+    def _forget_regions(self, session: Session, previous_transaction) -> None:
+        """Drop confirmed region IDs after a rollback (session event hook)."""
+        self._known_regions.clear()
+
     def _snapshot_to_dict(self, snapshot: RegionSnapshot) -> Dict[str, Any]:
         """Convert snapshot to dictionary."""
         return {
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.route import Route
 from .base import BaseService
@@ -22,9 +23,13 @@ class RouteService(BaseService[Route]):
     Provides CRUD operations plus route-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the route service."""
-        super().__init__(Route)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the route service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Route, session=session)
 
     def create_route(
         self,
@@ -54,7 +59,7 @@ class RouteService(BaseService[Route]):
         # Validate settlements exist
         from .settlement_service import SettlementService
 
-        with SettlementService() as settlement_service:
+        with SettlementService(session=self.session) as settlement_service:
             origin = settlement_service.get_by_id(origin_settlement_id)
             if origin is None:
                 raise ValueError(
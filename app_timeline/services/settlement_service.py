@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.settlement import Settlement
 from .base import BaseService
@@ -22,9 +23,13 @@ class SettlementService(BaseService[Settlement]):
     Provides CRUD operations plus settlement-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the settlement service."""
-        super().__init__(Settlement)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the settlement service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(Settlement, session=session)
 
     def create_settlement(
         self,
@@ -66,7 +71,7 @@ class SettlementService(BaseService[Settlement]):
         if province_id is not None:
             from .province_service import ProvinceService
 
-            with ProvinceService() as province_service:
+            with ProvinceService(session=self.session) as province_service:
                 province = province_service.get_by_id(province_id)
                 if province is None:
                     raise ValueError(f"Province with ID {province_id} does not exist")
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..models.settlement import SettlementSnapshot
 from .base import BaseService
@@ -22,9 +23,13 @@ class SnapshotService(BaseService[SettlementSnapshot]):
     Provides CRUD operations plus snapshot-specific queries.
     """
 
-    def __init__(self):
-        """Initialize the snapshot service."""
-        super().__init__(SettlementSnapshot)
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the snapshot service.
+
+        :param session: Optional existing session to share
+        """
+        super().__init__(SettlementSnapshot, session=session)
 
     def create_snapshot(
         self,
@@ -58,7 +63,7 @@ class SnapshotService(BaseService[SettlementSnapshot]):
         # Validate settlement exists
         from .settlement_service import SettlementService
 
-        with SettlementService() as settlement_service:
+        with SettlementService(session=self.session) as settlement_service:
             settlement = settlement_service.get_by_id(settlement_id)
             if settlement is None:
                 raise ValueError(f"Settlement with ID {settlement_id} does not exist")
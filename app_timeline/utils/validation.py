@@ -30,6 +30,14 @@ VALID_EVENT_TYPES = [
 VALID_ROUTE_TYPES = ["road", "trail", "river", "sea", "air"]
 VALID_ROUTE_DIFFICULTIES = ["easy", "moderate", "hard", "extreme"]
 
+# Hashed copies for membership checks; the lists above keep the order used
+# in error messages.
+_SETTLEMENT_TYPES = frozenset(VALID_SETTLEMENT_TYPES)
+_ENTITY_TYPES = frozenset(VALID_ENTITY_TYPES)
+_EVENT_TYPES = frozenset(VALID_EVENT_TYPES)
+_ROUTE_TYPES = frozenset(VALID_ROUTE_TYPES)
+_ROUTE_DIFFICULTIES = frozenset(VALID_ROUTE_DIFFICULTIES)
+
 # Grid constraints
 GRID_X_MIN = 1
 GRID_X_MAX = 40
@@ -90,7 +98,7 @@ def validate_settlement_type(settlement_type: str) -> None:
     :param settlement_type: Settlement type to validate
     :raises ValueError: If settlement type is invalid
     """
-    if settlement_type not in VALID_SETTLEMENT_TYPES:
+    if settlement_type not in _SETTLEMENT_TYPES:
         raise ValueError(
             f"Invalid settlement_type '{settlement_type}'. "
             f"Must be one of: {', '.join(VALID_SETTLEMENT_TYPES)}"
@@ -104,7 +112,7 @@ def validate_entity_type(entity_type: str) -> None:
     :param entity_type: Entity type to validate
     :raises ValueError: If entity type is invalid
     """
-    if entity_type not in VALID_ENTITY_TYPES:
+    if entity_type not in _ENTITY_TYPES:
         raise ValueError(
             f"Invalid entity_type '{entity_type}'. "
             f"Must be one of: {', '.join(VALID_ENTITY_TYPES)}"
@@ -118,7 +126,7 @@ def validate_event_type(event_type: str) -> None:
     :param event_type: Event type to validate
     :raises ValueError: If event type is invalid
     """
-    if event_type not in VALID_EVENT_TYPES:
+    if event_type not in _EVENT_TYPES:
         raise ValueError(
             f"Invalid event_type '{event_type}'. "
             f"Must be one of: {', '.join(VALID_EVENT_TYPES)}"
@@ -132,7 +140,7 @@ def validate_route_type(route_type: str) -> None:
     :param route_type: Route type to validate
     :raises ValueError: If route type is invalid
     """
-    if route_type not in VALID_ROUTE_TYPES:
+    if route_type not in _ROUTE_TYPES:
         raise ValueError(
             f"Invalid route_type '{route_type}'. "
             f"Must be one of: {', '.join(VALID_ROUTE_TYPES)}"
@@ -146,7 +154,7 @@ def validate_route_difficulty(difficulty: str) -> None:
     :param difficulty: Route difficulty to validate
     :raises ValueError: If difficulty is invalid
     """
-    if difficulty not in VALID_ROUTE_DIFFICULTIES:
+    if difficulty not in _ROUTE_DIFFICULTIES:
         raise ValueError(
             f"Invalid difficulty '{difficulty}'. "
             f"Must be one of: {', '.join(VALID_ROUTE_DIFFICULTIES)}"
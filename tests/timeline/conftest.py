@@ -2,17 +2,131 @@
 Pytest configuration and shared fixtures for timeline tests.
 """
 
+import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Iterator
 
 import pytest
-from sqlalchemy.orm import Session
+import typer
+from click import Command
+from click.testing import CliRunner
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, configure_mappers
 
-from app_timeline.config import TimelineConfig, reset_config
-from app_timeline.db import get_engine, get_session, reset_engine
+from app_timeline.cli import app
+from app_timeline.config import (
+    DatabaseConfig,
+    TimelineConfig,
+    get_config,
+    reset_config,
+    set_config,
+)
+from app_timeline.db import (
+    create_all_tables,
+    create_db_engine,
+    get_engine,
+    reset_engine,
+)
+from app_timeline.db.connection import get_session_factory
 from app_timeline.models import Base
 
+# Configure all ORM mappers up front rather than inside the first test
+configure_mappers()
+
+
+def _fast_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Skip journal files and fsyncs on the throwaway test databases.
+
+    Also turns off pysqlite's own transaction handling (see ``_emit_begin``).
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _emit_begin(connection: Connection) -> None:
+    """
+    Start SQLite transactions explicitly.
+
+    pysqlite defers BEGIN until the first DML statement and commits around
+    SAVEPOINTs, so the rolled-back test transactions below would leak.
+    """
+    connection.exec_driver_sql("BEGIN")
+
+
+def _configure_test_engine(engine: Engine) -> Engine:
+    """
+    Attach the test-only SQLite connection settings to ``engine``.
+
+    Must run before the engine opens its first connection. Non-SQLite
+    engines and engines that are already configured are left untouched.
+    """
+    if engine.dialect.name != "sqlite" or event.contains(
+        engine, "connect", _fast_sqlite_pragmas
+    ):
+        return engine
+
+    event.listen(engine, "connect", _fast_sqlite_pragmas)
+    event.listen(engine, "begin", _emit_begin)
+    return engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_config(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[TimelineConfig, None, None]:
+    """
+    Point the application at a private database for the whole session.
+
+    Each pytest-xdist worker gets its own database file, so parallel
+    workers never share (or touch) the on-disk database from settings.yaml.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_path = tmp_path_factory.mktemp(f"timeline_{worker_id}") / "timeline.db"
+
+    reset_config()
+    reset_engine()
+    config = get_config()
+    config.database = DatabaseConfig(path=str(db_path), dialect="sqlite")
+    set_config(config)
+    _configure_test_engine(get_engine())
+
+    yield config
+
+    reset_config()
+    reset_engine()
+
+
+@pytest.fixture(scope="session")
+def compiled_app() -> Command:
+    """Build the Click command tree for the Typer app once per session."""
+    return typer.main.get_command(app)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """
+    Shared CLI runner with plain, wide output.
+
+    NO_COLOR and TERM=dumb stop Rich from emitting ANSI escapes, and a fixed
+    COLUMNS avoids terminal-width detection and re-wrapping of tables.
+    Click 8.2+ always captures stderr separately (``result.stderr``).
+    """
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "200"})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_cli(runner: CliRunner, compiled_app: Command) -> None:
+    """Render the CLI help once so the first real test skips the warm-up."""
+    runner.invoke(compiled_app, ["--help"])
+
 
 @pytest.fixture
 def temp_db_path() -> Generator[Path, None, None]:
@@ -82,35 +196,116 @@ app:
 
 
 @pytest.fixture
-def test_config(test_config_yaml: Path) -> Generator[TimelineConfig, None, None]:
-    """Load test configuration."""
-    reset_config()
+def test_config(
+    test_config_yaml: Path, session_config: TimelineConfig
+) -> Generator[TimelineConfig, None, None]:
+    """Load test configuration and install it globally for the test."""
     config = TimelineConfig.from_yaml(test_config_yaml)
+    set_config(config)
+    reset_engine()
+    _configure_test_engine(get_engine())
 
     yield config
 
-    reset_config()
+    reset_engine()
+    set_config(session_config)
+    _configure_test_engine(get_engine())
+
+
+@contextmanager
+def _rolled_back_transaction(
+    connection: Connection, **session_kw
+) -> Iterator[Connection]:
+    """
+    Bind the global session factory to an outer transaction on ``connection``.
+
+    Every session from the factory joins the transaction, so service and
+    test commits become SAVEPOINT releases; the whole transaction is rolled
+    back on exit. Extra ``session_kw`` are applied to the factory meanwhile.
+    """
+    transaction = connection.begin()
+    factory = get_session_factory()
+    factory_kw = dict(factory.kw)
+    factory.configure(
+        bind=connection, join_transaction_mode="create_savepoint", **session_kw
+    )
+
+    try:
+        yield connection
+    finally:
+        factory.kw = factory_kw
+        transaction.rollback()
 
 
 @pytest.fixture
-def test_db(test_config: TimelineConfig) -> Generator[None, None, None]:
-    """Create a test database with all tables."""
-    reset_engine()
-    engine = get_engine()
+def db_transaction(
+    session_config: TimelineConfig,
+) -> Generator[Connection, None, None]:
+    """Run the test in a rolled-back transaction on the session engine."""
+    create_all_tables()
+    with get_engine().connect() as connection:
+        with _rolled_back_transaction(connection):
+            yield connection
+
+
+@pytest.fixture(scope="session")
+def memory_engine() -> Generator[Engine, None, None]:
+    """Shared in-memory SQLite engine with the full schema, built once."""
+    engine = _configure_test_engine(
+        create_db_engine(DatabaseConfig(path=":memory:", dialect="sqlite"))
+    )
     Base.metadata.create_all(engine)
 
-    yield
+    yield engine
 
-    Base.metadata.drop_all(engine)
-    reset_engine()
+    engine.dispose()
+
+
+@pytest.fixture(scope="class")
+def memory_connection(memory_engine: Engine) -> Generator[Connection, None, None]:
+    """Check out one connection to the in-memory database per test class."""
+    with memory_engine.connect() as connection:
+        yield connection
+
+
+@pytest.fixture
+def test_db(memory_connection: Connection) -> Generator[None, None, None]:
+    """
+    Provide the in-memory database; changes are rolled back afterwards.
+
+    Service sessions skip autoflush and keep their attributes loaded after
+    commit, so assertions on returned objects don't trigger reloads.
+    """
+    with _rolled_back_transaction(
+        memory_connection, autoflush=False, expire_on_commit=False
+    ):
+        yield
 
 
 @pytest.fixture
 def db_session(test_db) -> Generator[Session, None, None]:
-    """Create a database session for testing."""
-    session = get_session()
+    """
+    Create a database session for testing.
+
+    The session joins the outer test transaction, so ``commit()`` only
+    releases a SAVEPOINT and everything is discarded at teardown. Autoflush
+    is off: tests flush explicitly, and relationship reads in assertions
+    don't trigger extra flushes.
+    """
+    session = get_session_factory()(autoflush=False, expire_on_commit=False)
 
     yield session
 
     session.rollback()
     session.close()
+
+
+@pytest.fixture
+def bulk_add(db_session: Session) -> Callable[..., None]:
+    """Return a helper that adds objects to ``db_session`` and flushes once."""
+
+    def _bulk_add(*objs) -> None:
+        db_session.add_all(objs)
+        db_session.flush()
+
+    return _bulk_add
@@ -0,0 +1,43 @@
+"""
+tests.timeline.factories
+
+Builders for unsaved timeline model instances with test defaults.
+"""
+
+from typing import Type, TypeVar
+
+from app_timeline.models import Province, Region, Settlement
+
+SnapshotT = TypeVar("SnapshotT")
+
+
+def make_region(**overrides) -> Region:
+    """Build an unsaved Region; keyword overrides replace the defaults."""
+    return Region(**{"name": "Test Region", "founded_astro_day": 0, **overrides})
+
+
+def make_province(**overrides) -> Province:
+    """Build an unsaved Province; keyword overrides replace the defaults."""
+    return Province(**{"name": "Test Province", "founded_astro_day": 0, **overrides})
+
+
+def make_settlement(**overrides) -> Settlement:
+    """Build an unsaved Settlement; keyword overrides replace the defaults."""
+    return Settlement(
+        **{
+            "name": "Test Settlement",
+            "settlement_type": "hamlet",
+            "founded_astro_day": 0,
+            **overrides,
+        }
+    )
+
+
+def make_snapshot(snapshot_cls: Type[SnapshotT], **overrides) -> SnapshotT:
+    """
+    Build an unsaved region, province or settlement snapshot.
+
+    The parent (``region=``, ``province=`` or ``settlement=``, or its id)
+    must be passed as an override.
+    """
+    return snapshot_cls(**{"astro_day": 100, "population_total": 1000, **overrides})
@@ -13,6 +13,7 @@ import pytest
 from typer.testing import CliRunner
 
 from app_timeline.cli import app
+from app_timeline.db import drop_all_tables
 
 runner = CliRunner()
 
@@ -26,7 +27,7 @@ def setup_test_environment(tmp_path):
     yield tmp_path
 
     # Cleanup
-    runner.invoke(app, ["db", "drop", "--yes"])
+    drop_all_tables()
 
 
 class TestExportCommand:
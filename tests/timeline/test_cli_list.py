@@ -10,6 +10,7 @@ import pytest
 from typer.testing import CliRunner
 
 from app_timeline.cli import app
+from app_timeline.db import drop_all_tables
 
 runner = CliRunner()
 
@@ -163,7 +164,7 @@ def setup_test_data():
     yield
 
     # Cleanup after test
-    runner.invoke(app, ["db", "drop", "--yes"])
+    drop_all_tables()
 
 
 class TestEpochListCommands:
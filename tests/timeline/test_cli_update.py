@@ -7,377 +7,387 @@ Tests for CLI update and delete commands.
 from __future__ import annotations
 
 import pytest
-from typer.testing import CliRunner
 
-from app_timeline.cli import app
+from app_timeline.db import create_all_tables, drop_all_tables, get_session
+from app_timeline.models import (
+    Entity,
+    Epoch,
+    Event,
+    Province,
+    Region,
+    Route,
+    Settlement,
+    SettlementSnapshot,
+)
+
+
+def _seed_test_data() -> None:
+    """Insert the fixture rows (IDs 1..N) in a single transaction."""
+    with get_session() as session:
+        session.add_all(
+            [
+                Epoch(id=1, name="Test Epoch", start_astro_day=0, end_astro_day=100),
+                Region(id=1, name="Test Region"),
+                Province(id=1, name="Test Province", region_id=1),
+                Settlement(
+                    id=1, name="Test City", province_id=1, settlement_type="city"
+                ),
+                Settlement(
+                    id=2, name="Test Town", province_id=1, settlement_type="town"
+                ),
+                Entity(
+                    id=1, name="Test Person", entity_type="person", founded_astro_day=0
+                ),
+                Event(
+                    id=1,
+                    title="Test Event",
+                    event_type="founding",
+                    astro_day=50,
+                    settlement_id=1,
+                ),
+                Route(
+                    id=1,
+                    origin_settlement_id=1,
+                    destination_settlement_id=2,
+                    distance_km=50.5,
+                ),
+                SettlementSnapshot(
+                    id=1, settlement_id=1, astro_day=50, population_total=1000
+                ),
+            ]
+        )
+        session.commit()
 
-runner = CliRunner()
 
+@pytest.fixture(scope="module")
+def seeded_db_readonly():
+    """Create the schema and seed it once for every test in this module."""
+    drop_all_tables()
+    create_all_tables()
+    _seed_test_data()
 
-@pytest.fixture(autouse=True)
-def setup_test_data():
-    """Setup test data before each test."""
-    # Initialize database
-    runner.invoke(app, ["db", "init"])
+    yield
 
-    # Create test data
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-epoch",
-            "--name",
-            "Test Epoch",
-            "--start",
-            "0",
-            "--end",
-            "100",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app, ["data", "add-region", "--name", "Test Region", "--no-interactive"]
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-province",
-            "--name",
-            "Test Province",
-            "--region",
-            "1",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-settlement",
-            "--name",
-            "Test City",
-            "--type",
-            "city",
-            "--province",
-            "1",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-entity",
-            "--name",
-            "Test Person",
-            "--type",
-            "person",
-            "--founded",
-            "0",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-event",
-            "--title",
-            "Test Event",
-            "--type",
-            "founding",
-            "--day",
-            "50",
-            "--settlement",
-            "1",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-settlement",
-            "--name",
-            "Test Town",
-            "--type",
-            "town",
-            "--province",
-            "1",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
-        [
-            "data",
-            "add-route",
-            "--from",
-            "1",
-            "--to",
-            "2",
-            "--distance",
-            "50.5",
-            "--no-interactive",
-        ],
-    )
-    runner.invoke(
-        app,
+    drop_all_tables()
+
+
+@pytest.fixture
+def seeded_db_savepoint(request, seeded_db_readonly):
+    """
+    Wrap each test in the rolled-back ``db_transaction`` from conftest.
+
+    Updates therefore never reach the cached seed. Tests that use
+    ``seeded_db_writable`` are left unwrapped.
+    """
+    if "seeded_db_writable" not in request.fixturenames:
+        request.getfixturevalue("db_transaction")
+    yield
+
+
+@pytest.fixture
+def seeded_db_writable(seeded_db_readonly):
+    """Give a row-consuming test the seeded DB, then restore a fresh copy."""
+    yield
+
+    drop_all_tables()
+    create_all_tables()
+    _seed_test_data()
+
+
+@pytest.mark.usefixtures("seeded_db_savepoint")
+class TestRenameCommands:
+    """Tests for renaming records through update commands."""
+
+    @pytest.mark.parametrize(
+        "entity,option,new_name,message",
         [
-            "data",
-            "add-snapshot",
-            "--settlement",
-            "1",
-            "--day",
-            "50",
-            "--population",
-            "1000",
-            "--no-interactive",
+            ("region", "--name", "New Region", "Updated region 'New Region'"),
+            ("province", "--name", "New Province", "Updated province 'New Province'"),
+            ("settlement", "--name", "New City", "Updated city 'New City'"),
+            ("entity", "--name", "New Person", "Updated person 'New Person'"),
+            ("event", "--title", "New Event", "Updated founding event 'New Event'"),
         ],
     )
+    def test_update_name(self, runner, compiled_app, entity, option, new_name, message):
+        """Test updating the name (or title) of a record."""
+        result = runner.invoke(
+            compiled_app,
+            ["update", entity, "1", option, new_name],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert message in result.stdout
 
-    yield
 
-    # Cleanup
-    runner.invoke(app, ["db", "drop", "--yes"])
+@pytest.mark.usefixtures("seeded_db_savepoint")
+class TestSoftDeleteCommands:
+    """Tests for soft deleting records through delete commands."""
+
+    @pytest.mark.parametrize(
+        "entity", ["region", "province", "settlement", "entity", "route"]
+    )
+    def test_delete_soft(self, runner, compiled_app, entity):
+        """Test soft deleting (deactivating) a record."""
+        result = runner.invoke(
+            compiled_app,
+            ["update", f"delete-{entity}", "1", "--yes"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert f"Deactivated {entity}" in result.stdout
 
 
 class TestEpochUpdateCommands:
     """Tests for epoch update/delete commands."""
 
-    def test_update_epoch_name(self):
+    @pytest.mark.usefixtures("seeded_db_savepoint")
+    def test_update_epoch_name(self, runner, compiled_app):
         """Test updating epoch name."""
-        result = runner.invoke(app, ["update", "epoch", "1", "--name", "Updated Epoch"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "epoch", "1", "--name", "Updated Epoch"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated epoch 'Updated Epoch'" in result.stdout
 
         # Verify update
-        list_result = runner.invoke(app, ["list", "epochs"])
+        list_result = runner.invoke(compiled_app, ["list", "epochs"])
         assert "Updated Epoch" in list_result.stdout
 
-    def test_update_epoch_dates(self):
+    @pytest.mark.usefixtures("seeded_db_savepoint")
+    def test_update_epoch_dates(self, runner, compiled_app):
         """Test updating epoch date range."""
         result = runner.invoke(
-            app, ["update", "epoch", "1", "--start", "10", "--end", "200"]
+            compiled_app,
+            ["update", "epoch", "1", "--start", "10", "--end", "200"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert "Day 10 → 200" in result.stdout
 
-    def test_update_epoch_not_found(self):
+    @pytest.mark.usefixtures("db_transaction")
+    def test_update_epoch_not_found(self, runner, compiled_app):
         """Test updating non-existent epoch."""
-        result = runner.invoke(app, ["update", "epoch", "999", "--name", "Foo"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "epoch", "999", "--name", "Foo"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_update_epoch_no_fields(self):
+    def test_update_epoch_no_fields(self, runner, compiled_app):
         """Test update with no fields specified."""
-        result = runner.invoke(app, ["update", "epoch", "1"])
+        result = runner.invoke(
+            compiled_app, ["update", "epoch", "1"], catch_exceptions=False
+        )
         # Note: Currently exits with 0 (this is correct - no error occurred)
         assert result.exit_code == 0
         assert "No fields specified" in result.stdout
 
-    def test_delete_epoch(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_epoch(self, runner, compiled_app):
         """Test deleting an epoch."""
-        result = runner.invoke(app, ["update", "delete-epoch", "1", "--yes"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "delete-epoch", "1", "--yes"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         # Epochs don't have is_active, so they're hard deleted but message says "Deactivated"
         # This is a known UX quirk - the base service does hard delete correctly
         assert "epoch" in result.stdout.lower()
 
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestRegionUpdateCommands:
     """Tests for region update/delete commands."""
 
-    def test_update_region(self):
-        """Test updating region name."""
-        result = runner.invoke(app, ["update", "region", "1", "--name", "New Region"])
-        assert result.exit_code == 0
-        assert "Updated region 'New Region'" in result.stdout
-
-    def test_delete_region_soft(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_region_soft(self, runner, compiled_app):
         """Test soft deleting a region."""
-        result = runner.invoke(app, ["update", "delete-region", "1", "--yes"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "delete-region", "1", "--yes"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Deactivated region" in result.stdout
 
         # Verify soft delete - should not show without --all
-        list_result = runner.invoke(app, ["list", "regions"])
+        list_result = runner.invoke(compiled_app, ["list", "regions"])
         assert "No regions found" in list_result.stdout
 
         # Should show with --all
-        list_all_result = runner.invoke(app, ["list", "regions", "--all"])
+        list_all_result = runner.invoke(compiled_app, ["list", "regions", "--all"])
         assert "Test Region" in list_all_result.stdout
 
-    def test_delete_region_hard(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_region_hard(self, runner, compiled_app):
         """Test hard deleting a region."""
-        result = runner.invoke(app, ["update", "delete-region", "1", "--hard", "--yes"])
-        assert result.exit_code == 0
-        assert "Permanently deleted region" in result.stdout
-
-
-class TestProvinceUpdateCommands:
-    """Tests for province update/delete commands."""
-
-    def test_update_province(self):
-        """Test updating province."""
         result = runner.invoke(
-            app, ["update", "province", "1", "--name", "New Province"]
+            compiled_app,
+            ["update", "delete-region", "1", "--hard", "--yes"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
-        assert "Updated province 'New Province'" in result.stdout
-
-    def test_delete_province(self):
-        """Test deleting a province."""
-        result = runner.invoke(app, ["update", "delete-province", "1", "--yes"])
-        assert result.exit_code == 0
-        assert "Deactivated province" in result.stdout
+        assert "Permanently deleted region" in result.stdout
 
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestSettlementUpdateCommands:
     """Tests for settlement update/delete commands."""
 
-    def test_update_settlement_name(self):
-        """Test updating settlement name."""
-        result = runner.invoke(app, ["update", "settlement", "1", "--name", "New City"])
-        assert result.exit_code == 0
-        assert "Updated" in result.stdout
-        assert "New City" in result.stdout
-
-    def test_update_settlement_type(self):
+    def test_update_settlement_type(self, runner, compiled_app):
         """Test updating settlement type."""
         result = runner.invoke(
-            app, ["update", "settlement", "1", "--type", "metropolis"]
+            compiled_app,
+            ["update", "settlement", "1", "--type", "metropolis"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert "metropolis" in result.stdout
 
-    def test_update_settlement_grid(self):
+    def test_update_settlement_grid(self, runner, compiled_app):
         """Test updating settlement grid coordinates."""
         result = runner.invoke(
-            app, ["update", "settlement", "1", "--grid-x", "25", "--grid-y", "30"]
+            compiled_app,
+            ["update", "settlement", "1", "--grid-x", "25", "--grid-y", "30"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert "Updated" in result.stdout
 
-    def test_delete_settlement(self):
-        """Test deleting a settlement."""
-        result = runner.invoke(app, ["update", "delete-settlement", "1", "--yes"])
-        assert result.exit_code == 0
-        assert "Deactivated settlement" in result.stdout
-
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestEntityUpdateCommands:
     """Tests for entity update/delete commands."""
 
-    def test_update_entity_name(self):
-        """Test updating entity name."""
-        result = runner.invoke(app, ["update", "entity", "1", "--name", "New Person"])
-        assert result.exit_code == 0
-        assert "Updated" in result.stdout
-        assert "New Person" in result.stdout
-
-    def test_update_entity_dates(self):
+    def test_update_entity_dates(self, runner, compiled_app):
         """Test updating entity lifespan dates."""
         result = runner.invoke(
-            app, ["update", "entity", "1", "--founded", "10", "--dissolved", "100"]
+            compiled_app,
+            ["update", "entity", "1", "--founded", "10", "--dissolved", "100"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert "Updated" in result.stdout
 
-    def test_delete_entity(self):
-        """Test deleting an entity."""
-        result = runner.invoke(app, ["update", "delete-entity", "1", "--yes"])
-        assert result.exit_code == 0
-        assert "Deactivated entity" in result.stdout
-
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestEventUpdateCommands:
     """Tests for event update/delete commands."""
 
-    def test_update_event_title(self):
-        """Test updating event title."""
-        result = runner.invoke(app, ["update", "event", "1", "--title", "New Event"])
-        assert result.exit_code == 0
-        assert "Updated" in result.stdout
-        assert "New Event" in result.stdout
-
-    def test_update_event_day(self):
+    def test_update_event_day(self, runner, compiled_app):
         """Test updating event day."""
-        result = runner.invoke(app, ["update", "event", "1", "--day", "75"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "event", "1", "--day", "75"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated" in result.stdout
 
-    def test_delete_event(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_event(self, runner, compiled_app):
         """Test deleting (deprecating) an event."""
-        result = runner.invoke(app, ["update", "delete-event", "1", "--yes"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "delete-event", "1", "--yes"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Deprecated event" in result.stdout
 
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestRouteUpdateCommands:
     """Tests for route update/delete commands."""
 
-    def test_update_route_distance(self):
+    def test_update_route_distance(self, runner, compiled_app):
         """Test updating route distance."""
-        result = runner.invoke(app, ["update", "route", "1", "--distance", "75.5"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "route", "1", "--distance", "75.5"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated route" in result.stdout
 
-    def test_update_route_type(self):
+    def test_update_route_type(self, runner, compiled_app):
         """Test updating route type."""
-        result = runner.invoke(app, ["update", "route", "1", "--type", "highway"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "route", "1", "--type", "highway"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated route" in result.stdout
 
-    def test_delete_route(self):
-        """Test deleting a route."""
-        result = runner.invoke(app, ["update", "delete-route", "1", "--yes"])
-        assert result.exit_code == 0
-        assert "Deactivated route" in result.stdout
-
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestSnapshotUpdateCommands:
     """Tests for snapshot update/delete commands."""
 
-    def test_update_snapshot_population(self):
+    def test_update_snapshot_population(self, runner, compiled_app):
         """Test updating snapshot population."""
-        result = runner.invoke(app, ["update", "snapshot", "1", "--population", "2000"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "snapshot", "1", "--population", "2000"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated snapshot" in result.stdout
         assert "2,000" in result.stdout
 
-    def test_update_snapshot_day(self):
+    def test_update_snapshot_day(self, runner, compiled_app):
         """Test updating snapshot day."""
-        result = runner.invoke(app, ["update", "snapshot", "1", "--day", "60"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "snapshot", "1", "--day", "60"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Updated snapshot" in result.stdout
 
-    def test_delete_snapshot(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_snapshot(self, runner, compiled_app):
         """Test deleting a snapshot."""
-        result = runner.invoke(app, ["update", "delete-snapshot", "1", "--yes"])
+        result = runner.invoke(
+            compiled_app,
+            ["update", "delete-snapshot", "1", "--yes"],
+            catch_exceptions=False,
+        )
         assert result.exit_code == 0
         assert "Deleted snapshot" in result.stdout
 
 
+@pytest.mark.usefixtures("seeded_db_savepoint")
 class TestDeleteConfirmation:
     """Tests for delete confirmation prompts."""
 
-    def test_delete_without_confirmation(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_without_confirmation(self, runner, compiled_app):
         """Test that delete requires confirmation when --yes not provided."""
         # Simulate "no" response to confirmation
-        result = runner.invoke(app, ["update", "delete-region", "1"], input="n\n")
+        result = runner.invoke(
+            compiled_app, ["update", "delete-region", "1"], input="n\n"
+        )
         # Note: Rich's Confirm.ask() may cause exit code 1 in test environment
         # The important thing is that the deletion doesn't happen
         assert "Cancelled" in result.stdout or result.exit_code == 1
 
         # Verify region still exists
-        list_result = runner.invoke(app, ["list", "regions"])
+        list_result = runner.invoke(compiled_app, ["list", "regions"])
         assert "Test Region" in list_result.stdout
 
-    def test_delete_with_confirmation_yes(self):
+    @pytest.mark.usefixtures("seeded_db_writable")
+    def test_delete_with_confirmation_yes(self, runner, compiled_app):
         """Test that delete proceeds when user confirms."""
         # Simulate "yes" response to confirmation
-        result = runner.invoke(app, ["update", "delete-region", "1"], input="y\n")
+        result = runner.invoke(
+            compiled_app, ["update", "delete-region", "1"], input="y\n"
+        )
         assert result.exit_code == 0
         assert "Deactivated region" in result.stdout
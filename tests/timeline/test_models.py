@@ -2,10 +2,13 @@
 Tests for SQLAlchemy models and relationships.
 """
 
-from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Generator
 
-from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
+import pytest
+from sqlalchemy import DateTime, delete, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app_timeline.models import (
     Entity,
@@ -20,202 +23,341 @@ from app_timeline.models import (
     SettlementSnapshot,
 )
 
+from .factories import make_province, make_region, make_settlement, make_snapshot
+
+# Reusable Core INSERTs for rows that tests do not build through the ORM
+INSERT_REGION = insert(Region).returning(Region.id)
+INSERT_PROVINCE = insert(Province).returning(Province.id)
+INSERT_SETTLEMENT = insert(Settlement).returning(Settlement.id)
+INSERT_SETTLEMENT_SNAPSHOT = insert(SettlementSnapshot)
+INSERT_REGION_SNAPSHOT = insert(RegionSnapshot).returning(RegionSnapshot.id)
+INSERT_PROVINCE_SNAPSHOT = insert(ProvinceSnapshot).returning(ProvinceSnapshot.id)
+
+# Read-only constructor kwargs shared by the create tests
+_PERSON_KWARGS = MappingProxyType(
+    {
+        "entity_type": "person",
+        "description": "A legendary warrior",
+        "founded_astro_day": 0,  # birth
+        "dissolved_astro_day": 5000,  # death
+        "is_active": False,
+        "meta_data": {
+            "species": "huum",
+            "birth_place": "Ingar",
+            "roles": ["warrior", "leader"],
+        },
+    }
+)
+_ORGANIZATION_KWARGS = MappingProxyType(
+    {
+        "entity_type": "organization",
+        "description": "Merchant organization",
+        "founded_astro_day": 100,
+        "is_active": True,
+        "meta_data": {"type": "economic", "size": "large"},
+    }
+)
+_EVENT_KWARGS = MappingProxyType(
+    {
+        "astro_day": 100,
+        "event_type": "founding",
+        "title": "Town Founded",
+        "description": "A new settlement was established",
+        "location_x": 100,
+        "location_y": 200,
+        "is_deprecated": False,
+        "meta_data": {"tags": ["settlement", "founding"], "importance": "high"},
+    }
+)
 
-class TestRegionModel:
-    """Tests for Region model."""
-
-    def test_create_region(self, db_session: Session):
-        """Test creating a region."""
-        region = Region(
-            name="Northern Territories",
-            founded_astro_day=0,
-            is_active=True,
-            meta_data={"description": "Cold northern lands"},
-        )
-
-        db_session.add(region)
-        db_session.commit()
-
-        assert region.id is not None
-        assert region.name == "Northern Territories"
-        assert region.is_active is True
-        assert region.created_at is not None
-        assert isinstance(region.created_at, datetime)
-
-    def test_region_province_relationship(self, db_session: Session):
-        """Test relationship between regions and provinces."""
-        region = Region(name="Test Region", founded_astro_day=0)
-        province = Province(name="Test Province", founded_astro_day=0, region=region)
-
-        db_session.add(region)
-        db_session.add(province)
-        db_session.commit()
-
-        assert province.region_id == region.id
-        assert province in region.provinces
-
-
-class TestProvinceModel:
-    """Tests for Province model."""
-
-    def test_create_province(self, db_session: Session):
-        """Test creating a province."""
-        province = Province(
-            name="Fatunik Province",
-            founded_astro_day=100,
-            dissolved_astro_day=None,
-            is_active=True,
-            meta_data={"capital": "Ingar"},
-        )
-
-        db_session.add(province)
-        db_session.commit()
-
-        assert province.id is not None
-        assert province.name == "Fatunik Province"
-        assert province.founded_astro_day == 100
-        assert province.is_active is True
-
-
-class TestSettlementModel:
-    """Tests for Settlement model."""
-
-    def test_create_settlement(self, db_session: Session):
-        """Test creating a settlement."""
-        settlement = Settlement(
-            name="Ingar",
-            settlement_type="ring_town",
-            founded_astro_day=0,
-            location_x=100.5,
-            location_y=200.3,
-            is_active=True,
-            is_autonomous=False,
-            meta_data={"water": "fresh", "fertile": True},
-        )
-
-        db_session.add(settlement)
-        db_session.commit()
-
-        assert settlement.id is not None
-        assert settlement.name == "Ingar"
-        assert settlement.settlement_type == "ring_town"
-        assert settlement.location_x == 100.5
-        assert settlement.location_y == 200.3
-
-    def test_settlement_parent_relationship(self, db_session: Session):
-        """Test parent-child settlement relationship."""
-        ring_town = Settlement(
-            name="Parent Town",
-            settlement_type="ring_town",
-            founded_astro_day=0,
-        )
-        hamlet = Settlement(
-            name="Child Hamlet",
-            settlement_type="hamlet",
-            founded_astro_day=10,
-            parent=ring_town,
-        )
-
-        db_session.add(ring_town)
-        db_session.add(hamlet)
-        db_session.commit()
 
-        assert hamlet.parent_settlement_id == ring_town.id
-        assert hamlet in ring_town.satellites
-
-    def test_settlement_province_relationship(self, db_session: Session):
-        """Test settlement-province relationship."""
-        province = Province(name="Test Province", founded_astro_day=0)
-        settlement = Settlement(
-            name="Test Settlement",
-            settlement_type="hamlet",
-            founded_astro_day=0,
-            province=province,
+# Read-only metadata payloads for the MetadataMixin tests; copy with dict()
+# before assigning them to a model
+_FLAT_META = MappingProxyType(
+    {"key1": "value1", "key2": 123, "key3": True, "key4": None}
+)
+_BASE_META = MappingProxyType({"key1": "value1", "key2": "value2"})
+_NESTED_META = MappingProxyType({"nested": {"key": "value"}})
+_ARRAY_META = MappingProxyType({"tags": ["tag1", "tag2"]})
+
+
+class TestCreateBasicModel:
+    """Tests for creating standalone model rows."""
+
+    @pytest.mark.parametrize(
+        "model_cls,ctor_kwargs,expected_attrs",
+        [
+            pytest.param(
+                Region,
+                {
+                    "name": "Northern Territories",
+                    "founded_astro_day": 0,
+                    "is_active": True,
+                    "meta_data": {"description": "Cold northern lands"},
+                },
+                {"name": "Northern Territories", "is_active": True},
+                id="region",
+            ),
+            pytest.param(
+                Province,
+                {
+                    "name": "Fatunik Province",
+                    "founded_astro_day": 100,
+                    "dissolved_astro_day": None,
+                    "is_active": True,
+                    "meta_data": {"capital": "Ingar"},
+                },
+                {
+                    "name": "Fatunik Province",
+                    "founded_astro_day": 100,
+                    "is_active": True,
+                },
+                id="province",
+            ),
+            pytest.param(
+                Settlement,
+                {
+                    "name": "Ingar",
+                    "settlement_type": "ring_town",
+                    "founded_astro_day": 0,
+                    "location_x": 100.5,
+                    "location_y": 200.3,
+                    "is_active": True,
+                    "is_autonomous": False,
+                    "meta_data": {"water": "fresh", "fertile": True},
+                },
+                {
+                    "name": "Ingar",
+                    "settlement_type": "ring_town",
+                    "location_x": 100.5,
+                    "location_y": 200.3,
+                },
+                id="settlement",
+            ),
+            pytest.param(
+                Entity,
+                {"name": "Warrior Chief", **_PERSON_KWARGS},
+                {
+                    "name": "Warrior Chief",
+                    "entity_type": "person",
+                    "meta_data": _PERSON_KWARGS["meta_data"],
+                },
+                id="person_entity",
+            ),
+            pytest.param(
+                Entity,
+                {"name": "Traders Guild", **_ORGANIZATION_KWARGS},
+                {
+                    "name": "Traders Guild",
+                    "entity_type": "organization",
+                    "meta_data": _ORGANIZATION_KWARGS["meta_data"],
+                },
+                id="organization_entity",
+            ),
+        ],
+    )
+    def test_create_basic_model(self, bulk_add, model_cls, ctor_kwargs, expected_attrs):
+        """Test creating a record and reading back its attributes."""
+        instance = model_cls(**ctor_kwargs)
+
+        bulk_add(instance)
+
+        assert instance.id is not None
+        assert instance.created_at is not None
+        for attr, expected in expected_attrs.items():
+            assert getattr(instance, attr) == expected
+
+    @pytest.mark.parametrize("model_cls", [Region, Province, Settlement])
+    def test_created_at_column_type(self, model_cls):
+        """Test that created_at is mapped as a DateTime column."""
+        assert isinstance(model_cls.__table__.c.created_at.type, DateTime)
+
+
+@pytest.fixture
+def relationship_graph(bulk_add) -> SimpleNamespace:
+    """
+    Build and flush one linked object graph for the relationship tests.
+
+    A region holds a province with a ring town and its satellite hamlet;
+    the region, province and hamlet each have snapshots.
+    """
+    region = make_region()
+    province = make_province(region=region)
+    ring_town = make_settlement(
+        name="Ring Town", settlement_type="ring_town", province=province
+    )
+    hamlet = make_settlement(
+        name="Child Hamlet", founded_astro_day=10, parent=ring_town, province=province
+    )
+    region_snapshot = make_snapshot(
+        RegionSnapshot, region=region, population_total=50000
+    )
+    province_snapshot = make_snapshot(
+        ProvinceSnapshot, province=province, population_total=20000
+    )
+    hamlet_snapshots = [
+        make_snapshot(
+            SettlementSnapshot, settlement=hamlet, astro_day=0, population_total=100
+        ),
+        make_snapshot(SettlementSnapshot, settlement=hamlet, population_total=500),
+    ]
+
+    bulk_add(
+        region,
+        province,
+        ring_town,
+        hamlet,
+        region_snapshot,
+        province_snapshot,
+        *hamlet_snapshots,
+    )
+
+    return SimpleNamespace(
+        region=region,
+        province=province,
+        ring_town=ring_town,
+        hamlet=hamlet,
+        region_snapshot=region_snapshot,
+        province_snapshot=province_snapshot,
+        hamlet_snapshots=hamlet_snapshots,
+    )
+
+
+class TestModelRelationships:
+    """Tests for relationships between regions, provinces and settlements."""
+
+    def test_relationships(self, relationship_graph: SimpleNamespace):
+        """Test foreign keys and collections across the linked model graph."""
+        graph = relationship_graph
+
+        # Collection membership is checked by identity, not model __eq__
+
+        # Region -> provinces
+        assert graph.province.region_id == graph.region.id
+        assert any(p is graph.province for p in graph.region.provinces)
+
+        # Settlement parent -> satellites
+        assert graph.hamlet.parent_settlement_id == graph.ring_town.id
+        assert any(s is graph.hamlet for s in graph.ring_town.satellites)
+
+        # Province -> settlements
+        assert graph.hamlet.province_id == graph.province.id
+        assert any(s is graph.hamlet for s in graph.province.settlements)
+
+        # Region and province snapshots
+        assert graph.region_snapshot.region_id == graph.region.id
+        assert any(snap is graph.region_snapshot for snap in graph.region.snapshots)
+        assert graph.province_snapshot.province_id == graph.province.id
+        assert any(snap is graph.province_snapshot for snap in graph.province.snapshots)
+
+        # Multiple snapshots per settlement
+        assert [snap.population_total for snap in graph.hamlet.snapshots] == [
+            100,
+            500,
+        ]
+        assert all(
+            snap.settlement_id == graph.hamlet.id for snap in graph.hamlet_snapshots
+        )
+
+    def test_relationships_eager_loaded(
+        self, db_session: Session, relationship_graph: SimpleNamespace
+    ):
+        """Test that the stored graph reloads in one batch with selectinload."""
+        region_id = relationship_graph.region.id
+        db_session.expunge_all()
+
+        region = db_session.scalars(
+            select(Region)
+            .where(Region.id == region_id)
+            .options(
+                selectinload(Region.snapshots),
+                selectinload(Region.provinces).selectinload(Province.snapshots),
+                selectinload(Region.provinces)
+                .selectinload(Province.settlements)
+                .selectinload(Settlement.snapshots),
+                raiseload("*"),  # Fail on any lazy load the options missed
+            )
+        ).one()
+
+        (province,) = region.provinces
+        assert len(region.snapshots) == 1
+        assert len(province.snapshots) == 1
+        assert {s.name for s in province.settlements} == {"Ring Town", "Child Hamlet"}
+        hamlet = next(s for s in province.settlements if s.name == "Child Hamlet")
+        assert sorted(snap.population_total for snap in hamlet.snapshots) == [100, 500]
+
+
+@pytest.fixture(scope="class")
+def seeded_settlements(
+    memory_connection: Connection,
+) -> Generator[Dict[str, int], None, None]:
+    """
+    Bulk-insert prototype settlements once per test class.
+
+    Returns settlement IDs keyed by settlement type. Tests load them with
+    ``db_session.get()``; their own changes are rolled back per test and
+    the prototypes are deleted when the class finishes.
+    """
+    rows = [
+        {"name": "Proto Ring Town", "settlement_type": "ring_town"},
+        {"name": "Proto Market Town", "settlement_type": "market_town"},
+        {"name": "Proto Hamlet", "settlement_type": "hamlet"},
+    ]
+    with memory_connection.begin():
+        result = memory_connection.execute(
+            insert(Settlement).returning(Settlement.id, Settlement.settlement_type),
+            [{**row, "founded_astro_day": 0} for row in rows],
+        )
+        ids = {settlement_type: sid for sid, settlement_type in result}
+
+    yield ids
+
+    with memory_connection.begin():
+        memory_connection.execute(
+            delete(Settlement).where(Settlement.id.in_(ids.values()))
         )
 
-        db_session.add(province)
-        db_session.add(settlement)
-        db_session.commit()
-
-        assert settlement.province_id == province.id
-        assert settlement in province.settlements
-
 
 class TestSettlementSnapshotModel:
     """Tests for SettlementSnapshot model."""
 
-    def test_create_snapshot(self, db_session: Session):
+    def test_create_snapshot(
+        self, db_session: Session, seeded_settlements: Dict[str, int]
+    ):
         """Test creating a settlement snapshot."""
-        settlement = Settlement(
-            name="Test Town",
-            settlement_type="market_town",
-            founded_astro_day=0,
-        )
-
-        snapshot = SettlementSnapshot(
-            settlement=settlement,
-            astro_day=100,
-            population_total=5000,
-            population_by_species={"huum": 4500, "sint": 500},
-            population_by_habitat={"on_ground": 5000},
-            cultural_composition={"language": "Fatuni"},
-            economic_data={"primary_industry": "agriculture"},
-        )
-
-        db_session.add(settlement)
-        db_session.add(snapshot)
-        db_session.commit()
+        settlement_id = seeded_settlements["market_town"]
+
+        snapshot_id = db_session.execute(
+            INSERT_SETTLEMENT_SNAPSHOT.returning(SettlementSnapshot.id),
+            {
+                "settlement_id": settlement_id,
+                "astro_day": 100,
+                "population_total": 5000,
+                "population_by_species": {"huum": 4500, "sint": 500},
+                "population_by_habitat": {"on_ground": 5000},
+                "cultural_composition": {"language": "Fatuni"},
+                "economic_data": {"primary_industry": "agriculture"},
+            },
+        ).scalar_one()
+        snapshot = db_session.get(SettlementSnapshot, snapshot_id)
 
-        assert snapshot.id is not None
-        assert snapshot.settlement_id == settlement.id
+        assert snapshot.settlement_id == settlement_id
         assert snapshot.astro_day == 100
         assert snapshot.population_total == 5000
         assert snapshot.population_by_species["huum"] == 4500
 
-    def test_multiple_snapshots_per_settlement(self, db_session: Session):
-        """Test that settlements can have multiple snapshots."""
-        settlement = Settlement(
-            name="Growing Town",
-            settlement_type="hamlet",
-            founded_astro_day=0,
-        )
-
-        snapshot1 = SettlementSnapshot(
-            settlement=settlement,
-            astro_day=0,
-            population_total=100,
-        )
-        snapshot2 = SettlementSnapshot(
-            settlement=settlement,
-            astro_day=100,
-            population_total=500,
-        )
-
-        db_session.add(settlement)
-        db_session.add(snapshot1)
-        db_session.add(snapshot2)
-        db_session.commit()
-
-        assert len(settlement.snapshots) == 2
-        assert snapshot1 in settlement.snapshots
-        assert snapshot2 in settlement.snapshots
-
 
 class TestRouteModel:
     """Tests for Route model."""
 
-    def test_create_route(self, db_session: Session):
+    def test_create_route(self, bulk_add):
         """Test creating a route between settlements."""
-        origin = Settlement(
-            name="Town A", settlement_type="ring_town", founded_astro_day=0
-        )
-        destination = Settlement(
-            name="Town B", settlement_type="market_town", founded_astro_day=0
-        )
+        origin = make_settlement(name="Town A", settlement_type="ring_town")
+        destination = make_settlement(name="Town B", settlement_type="market_town")
 
         route = Route(
-            origin_settlement_id=None,  # Will be set after adding settlements
-            destination_settlement_id=None,
+            origin_settlement=origin,
+            destination_settlement=destination,
             founded_astro_day=10,
             distance_km=50.5,
             difficulty="moderate",
@@ -224,132 +366,62 @@ class TestRouteModel:
             meta_data={"terrain": "plains"},
         )
 
-        db_session.add(origin)
-        db_session.add(destination)
-        db_session.flush()  # Get IDs
-
-        route.origin_settlement_id = origin.id
-        route.destination_settlement_id = destination.id
-
-        db_session.add(route)
-        db_session.commit()
+        bulk_add(origin, destination, route)
 
         assert route.id is not None
+        assert route.origin_settlement_id == origin.id
+        assert route.destination_settlement_id == destination.id
         assert route.distance_km == 50.5
         assert route.difficulty == "moderate"
         assert route.route_type == "road"
 
 
-class TestEntityModel:
-    """Tests for Entity model."""
-
-    def test_create_person_entity(self, db_session: Session):
-        """Test creating a person entity."""
-        person = Entity(
-            name="Warrior Chief",
-            entity_type="person",
-            description="A legendary warrior",
-            founded_astro_day=0,  # birth
-            dissolved_astro_day=5000,  # death
-            is_active=False,
-            meta_data={
-                "species": "huum",
-                "birth_place": "Ingar",
-                "roles": ["warrior", "leader"],
-            },
-        )
-
-        db_session.add(person)
-        db_session.commit()
-
-        assert person.id is not None
-        assert person.name == "Warrior Chief"
-        assert person.entity_type == "person"
-        assert person.meta_data["species"] == "huum"
-
-    def test_create_organization_entity(self, db_session: Session):
-        """Test creating an organization entity."""
-        org = Entity(
-            name="Traders Guild",
-            entity_type="organization",
-            description="Merchant organization",
-            founded_astro_day=100,
-            is_active=True,
-            meta_data={"type": "economic", "size": "large"},
-        )
-
-        db_session.add(org)
-        db_session.commit()
-
-        assert org.id is not None
-        assert org.entity_type == "organization"
-
-
 class TestEventModel:
     """Tests for Event model."""
 
-    def test_create_event(self, db_session: Session):
+    def test_create_event(self, db_session: Session, bulk_add):
         """Test creating an event."""
-        settlement = Settlement(
-            name="Event Town", settlement_type="hamlet", founded_astro_day=0
-        )
-        db_session.add(settlement)
-        db_session.flush()
+        settlement_id = db_session.execute(
+            INSERT_SETTLEMENT,
+            {"name": "Event Town", "settlement_type": "hamlet", "founded_astro_day": 0},
+        ).scalar_one()
 
-        event = Event(
-            astro_day=100,
-            event_type="founding",
-            title="Town Founded",
-            description="A new settlement was established",
-            location_x=100,
-            location_y=200,
-            settlement_id=settlement.id,
-            is_deprecated=False,
-            meta_data={"tags": ["settlement", "founding"], "importance": "high"},
-        )
+        event = Event(settlement_id=settlement_id, **_EVENT_KWARGS)
 
-        db_session.add(event)
-        db_session.commit()
+        bulk_add(event)
 
         assert event.id is not None
         assert event.astro_day == 100
         assert event.event_type == "founding"
         assert event.title == "Town Founded"
 
-    def test_event_deprecation(self, db_session: Session):
+    def test_event_deprecation(self, db_session: Session, bulk_add):
         """Test event deprecation and superseding."""
         # Create region for event location association
-        region = Region(name="Test Region")
-        db_session.add(region)
-        db_session.flush()
-
-        event1 = Event(
-            astro_day=100,
-            event_type="battle",
-            title="Original Event",
-            description="Original description",
-            region_id=region.id,
-        )
-
-        db_session.add(event1)
-        db_session.flush()
+        region_id = db_session.execute(
+            INSERT_REGION, {"name": "Test Region"}
+        ).scalar_one()
 
         event2 = Event(
             astro_day=100,
             event_type="battle",
             title="Corrected Event",
             description="Corrected description",
-            region_id=region.id,
+            region_id=region_id,
         )
 
-        db_session.add(event2)
-        db_session.flush()
-
-        # Mark first event as deprecated
-        event1.is_deprecated = True
-        event1.superseded_by_id = event2.id
+        # First event is deprecated and superseded by the correction
+        event1 = Event(
+            astro_day=100,
+            event_type="battle",
+            title="Original Event",
+            description="Original description",
+            region_id=region_id,
+            is_deprecated=True,
+            superseded_by=event2,
+        )
 
-        db_session.commit()
+        bulk_add(event1, event2)
 
         assert event1.is_deprecated is True
         assert event1.superseded_by_id == event2.id
@@ -358,7 +430,7 @@ class TestEventModel:
 class TestDescriptionMixin:
     """Tests for DescriptionMixin (PR-003a / ADR-008)."""
 
-    def test_epoch_description(self, db_session: Session):
+    def test_epoch_description(self, bulk_add):
         """Test description field on Epoch model."""
         epoch = Epoch(
             name="Test Epoch",
@@ -367,20 +439,17 @@ class TestDescriptionMixin:
             description="Initial test period",
         )
 
-        db_session.add(epoch)
-        db_session.commit()
+        bulk_add(epoch)
 
         assert epoch.description == "Initial test period"
         assert epoch.has_description() is True
 
     def test_update_description(self, db_session: Session):
         """Test updating description programmatically."""
-        region = Region(name="Test Region", founded_astro_day=0)
-        db_session.add(region)
-        db_session.commit()
-
-        # Update description
+        region = make_region()
         region.update_description("Updated description")
+
+        db_session.add(region)
         db_session.commit()
 
         assert region.description == "Updated description"
@@ -388,56 +457,75 @@ class TestDescriptionMixin:
 
     def test_clear_description(self, db_session: Session):
         """Test clearing description."""
-        province = Province(
-            name="Test Province",
-            founded_astro_day=0,
-            description="Initial description",
-        )
-        db_session.add(province)
-        db_session.commit()
-
+        province = make_province(description="Initial description")
         province.clear_description()
+
+        db_session.add(province)
         db_session.commit()
 
         assert province.description is None
         assert province.has_description() is False
 
 
+@pytest.fixture(scope="class")
+def metadata_owners(
+    memory_connection: Connection,
+) -> Generator[Dict[type, int], None, None]:
+    """
+    Insert one region and one province once per test class.
+
+    Returns their IDs keyed by model class. Each test loads them with
+    ``db_session.get()`` and sets its own meta_data; the changes are rolled
+    back per test and the rows are deleted when the class finishes.
+    """
+    with memory_connection.begin():
+        ids = {
+            Region: memory_connection.execute(
+                INSERT_REGION, {"name": "Test Region", "founded_astro_day": 0}
+            ).scalar_one(),
+            Province: memory_connection.execute(
+                INSERT_PROVINCE, {"name": "Test Province", "founded_astro_day": 0}
+            ).scalar_one(),
+        }
+
+    yield ids
+
+    with memory_connection.begin():
+        memory_connection.execute(delete(Province).where(Province.id == ids[Province]))
+        memory_connection.execute(delete(Region).where(Region.id == ids[Region]))
+
+
 class TestMetadataMixin:
-    """Tests for MetadataMixin (PR-003a / ADR-008)."""
+    """
+    Tests for MetadataMixin (PR-003a / ADR-008).
 
-    def test_metadata_flat_structure_valid(self, db_session: Session):
+    meta_data is a MutableDict-tracked column, so in-place changes are
+    persisted without flag_modified().
+    """
+
+    def test_metadata_flat_structure_valid(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test that flat metadata structure is accepted."""
-        region = Region(
-            name="Test Region",
-            founded_astro_day=0,
-            meta_data={"key1": "value1", "key2": 123, "key3": True, "key4": None},
-        )
+        region = db_session.get(Region, metadata_owners[Region])
+        region.meta_data = dict(_FLAT_META)
 
-        db_session.add(region)
-        db_session.commit()
+        db_session.flush()
 
-        assert region.meta_data == {
-            "key1": "value1",
-            "key2": 123,
-            "key3": True,
-            "key4": None,
-        }
+        assert region.meta_data == _FLAT_META
 
-    def test_update_metadata_merge(self, db_session: Session):
+    def test_update_metadata_merge(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test merging metadata updates."""
-        region = Region(
-            name="Test Region",
-            founded_astro_day=0,
-            meta_data={"key1": "value1", "key2": "value2"},
-        )
-        db_session.add(region)
-        db_session.commit()
+        region = db_session.get(Region, metadata_owners[Region])
+        region.meta_data = dict(_BASE_META)
+        db_session.flush()  # Stored value, so the merge must be tracked as an UPDATE
 
         # Merge new values
         region.update_metadata({"key2": "updated", "key3": "new"}, mode="merge")
-        flag_modified(region, "meta_data")  # Tell SQLAlchemy we modified the JSON field
         db_session.commit()
+        db_session.refresh(region)  # Read back the persisted JSON
 
         assert region.meta_data == {
             "key1": "value1",
@@ -445,15 +533,12 @@ class TestMetadataMixin:
             "key3": "new",
         }
 
-    def test_update_metadata_replace(self, db_session: Session):
+    def test_update_metadata_replace(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test replacing metadata."""
-        province = Province(
-            name="Test Province",
-            founded_astro_day=0,
-            meta_data={"key1": "value1", "key2": "value2"},
-        )
-        db_session.add(province)
-        db_session.commit()
+        province = db_session.get(Province, metadata_owners[Province])
+        province.meta_data = dict(_BASE_META)
 
         # Replace entirely
         province.update_metadata({"key3": "value3"}, mode="replace")
@@ -461,90 +546,74 @@ class TestMetadataMixin:
 
         assert province.meta_data == {"key3": "value3"}
 
-    def test_remove_metadata_keys(self, db_session: Session):
+    def test_remove_metadata_keys(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test removing specific metadata keys."""
-        region = Region(
-            name="Test Region",
-            founded_astro_day=0,
-            meta_data={"key1": "value1", "key2": "value2", "key3": "value3"},
-        )
-        db_session.add(region)
-        db_session.commit()
+        region = db_session.get(Region, metadata_owners[Region])
+        region.meta_data = {"key1": "value1", "key2": "value2", "key3": "value3"}
+        db_session.flush()  # Stored value, so the removal must be tracked as an UPDATE
 
         region.remove_metadata_keys(["key2"])
-        flag_modified(region, "meta_data")  # Tell SQLAlchemy we modified the JSON field
         db_session.commit()
+        db_session.refresh(region)  # Read back the persisted JSON
 
         assert region.meta_data == {"key1": "value1", "key3": "value3"}
 
-    def test_clear_metadata(self, db_session: Session):
+    def test_clear_metadata(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test clearing all metadata."""
-        province = Province(
-            name="Test Province",
-            founded_astro_day=0,
-            meta_data={"key1": "value1"},
-        )
-        db_session.add(province)
-        db_session.commit()
-
+        province = db_session.get(Province, metadata_owners[Province])
+        province.meta_data = {"key1": "value1"}
         province.clear_metadata()
+
         db_session.commit()
 
         assert province.meta_data is None
 
-    def test_get_metadata_value(self, db_session: Session):
+    def test_get_metadata_value(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test getting specific metadata value."""
-        region = Region(
-            name="Test Region",
-            founded_astro_day=0,
-            meta_data={"key1": "value1", "key2": 123},
-        )
-        db_session.add(region)
-        db_session.commit()
+        region = db_session.get(Region, metadata_owners[Region])
+        region.meta_data = {"key1": "value1", "key2": 123}
 
         assert region.get_metadata_value("key1") == "value1"
         assert region.get_metadata_value("key2") == 123
         assert region.get_metadata_value("nonexistent") is None
         assert region.get_metadata_value("nonexistent", "default") == "default"
 
-    def test_has_metadata_key(self, db_session: Session):
+    def test_has_metadata_key(
+        self, db_session: Session, metadata_owners: Dict[type, int]
+    ):
         """Test checking if metadata key exists."""
-        province = Province(
-            name="Test Province",
-            founded_astro_day=0,
-            meta_data={"key1": "value1"},
-        )
-        db_session.add(province)
-        db_session.commit()
+        province = db_session.get(Province, metadata_owners[Province])
+        province.meta_data = {"key1": "value1"}
 
         assert province.has_metadata_key("key1") is True
         assert province.has_metadata_key("nonexistent") is False
 
-    def test_metadata_nested_object_rejected(self, db_session: Session):
-        """Test that nested objects in metadata are rejected."""
-        region = Region(name="Test Region", founded_astro_day=0, meta_data={})
-        db_session.add(region)
-        db_session.commit()
-
-        # Attempt to add nested object
-        try:
-            region.update_metadata({"nested": {"key": "value"}})
-            assert False, "Should have raised ValueError"
-        except ValueError as e:
-            assert "Nested objects not allowed" in str(e)
-
-    def test_metadata_array_rejected(self, db_session: Session):
-        """Test that arrays in metadata are rejected."""
-        province = Province(name="Test Province", founded_astro_day=0, meta_data={})
-        db_session.add(province)
-        db_session.commit()
-
-        # Attempt to add array
-        try:
-            province.update_metadata({"tags": ["tag1", "tag2"]})
-            assert False, "Should have raised ValueError"
-        except ValueError as e:
-            assert "Arrays not allowed" in str(e)
+    @pytest.mark.parametrize(
+        "model_cls,payload,message",
+        [
+            (Region, _NESTED_META, "Nested objects not allowed"),
+            (Province, _ARRAY_META, "Arrays not allowed"),
+        ],
+    )
+    def test_metadata_non_flat_rejected(
+        self,
+        db_session: Session,
+        metadata_owners: Dict[type, int],
+        model_cls,
+        payload,
+        message,
+    ):
+        """Test that nested objects and arrays in metadata are rejected."""
+        instance = db_session.get(model_cls, metadata_owners[model_cls])
+
+        with pytest.raises(ValueError, match=message):
+            instance.update_metadata(payload)
 
 
 class TestRegionSnapshotModel:
@@ -552,64 +621,47 @@ class TestRegionSnapshotModel:
 
     def test_create_region_snapshot(self, db_session: Session):
         """Test creating a region snapshot."""
-        region = Region(name="Test Region", founded_astro_day=0)
-        db_session.add(region)
-        db_session.flush()
-
-        snapshot = RegionSnapshot(
-            region_id=region.id,
-            astro_day=100,
-            snapshot_type="census",
-            granularity="year",
-            population_total=50000,
-            population_by_species={"huum": 30000, "sint": 20000},
-            population_by_habitat={"on_ground": 45000, "under_ground": 5000},
-            cultural_composition={"language": "Fatuni"},
-            economic_data={"primary_industry": "agriculture"},
-            meta_data={"source": "census_2025"},
-        )
-
-        db_session.add(snapshot)
-        db_session.commit()
+        region_id = db_session.execute(
+            INSERT_REGION, {"name": "Test Region", "founded_astro_day": 0}
+        ).scalar_one()
+
+        snapshot_id = db_session.execute(
+            INSERT_REGION_SNAPSHOT,
+            {
+                "region_id": region_id,
+                "astro_day": 100,
+                "snapshot_type": "census",
+                "granularity": "year",
+                "population_total": 50000,
+                "population_by_species": {"huum": 30000, "sint": 20000},
+                "population_by_habitat": {"on_ground": 45000, "under_ground": 5000},
+                "cultural_composition": {"language": "Fatuni"},
+                "economic_data": {"primary_industry": "agriculture"},
+                "meta_data": {"source": "census_2025"},
+            },
+        ).scalar_one()
+        snapshot = db_session.get(RegionSnapshot, snapshot_id)
 
-        assert snapshot.id is not None
-        assert snapshot.region_id == region.id
+        assert snapshot.region_id == region_id
         assert snapshot.astro_day == 100
         assert snapshot.snapshot_type == "census"
         assert snapshot.granularity == "year"
         assert snapshot.population_total == 50000
 
-    def test_region_snapshot_relationship(self, db_session: Session):
-        """Test relationship between region and snapshots."""
-        region = Region(name="Test Region", founded_astro_day=0)
-        snapshot = RegionSnapshot(
-            region=region,
-            astro_day=100,
-            population_total=50000,
-        )
-
-        db_session.add(region)
-        db_session.add(snapshot)
-        db_session.commit()
-
-        assert snapshot.region_id == region.id
-        assert snapshot in region.snapshots
-
-    def test_region_snapshot_check_constraints(self, db_session: Session):
+    def test_region_snapshot_check_constraints(self, db_session: Session, bulk_add):
         """Test CHECK constraints on RegionSnapshot."""
-        region = Region(name="Test Region", founded_astro_day=0)
-        db_session.add(region)
-        db_session.flush()
+        region_id = db_session.execute(
+            INSERT_REGION, {"name": "Test Region", "founded_astro_day": 0}
+        ).scalar_one()
 
         # This should be caught by service layer, but test at model level
         # Note: SQLite doesn't enforce CHECK constraints by default in all configs
         snapshot = RegionSnapshot(
-            region_id=region.id,
+            region_id=region_id,
             astro_day=100,
             population_total=50000,  # Valid
         )
-        db_session.add(snapshot)
-        db_session.commit()
+        bulk_add(snapshot)
 
         assert snapshot.population_total >= 0
         assert snapshot.astro_day >= 0
@@ -620,67 +672,53 @@ class TestProvinceSnapshotModel:
 
     def test_create_province_snapshot(self, db_session: Session):
         """Test creating a province snapshot."""
-        province = Province(name="Test Province", founded_astro_day=0)
-        db_session.add(province)
-        db_session.flush()
-
-        snapshot = ProvinceSnapshot(
-            province_id=province.id,
-            astro_day=200,
-            snapshot_type="simulation",
-            granularity="decade",
-            population_total=20000,
-            population_by_species={"huum": 15000, "sint": 5000},
-        )
-
-        db_session.add(snapshot)
-        db_session.commit()
+        province_id = db_session.execute(
+            INSERT_PROVINCE, {"name": "Test Province", "founded_astro_day": 0}
+        ).scalar_one()
+
+        snapshot_id = db_session.execute(
+            INSERT_PROVINCE_SNAPSHOT,
+            {
+                "province_id": province_id,
+                "astro_day": 200,
+                "snapshot_type": "simulation",
+                "granularity": "decade",
+                "population_total": 20000,
+                "population_by_species": {"huum": 15000, "sint": 5000},
+            },
+        ).scalar_one()
+        snapshot = db_session.get(ProvinceSnapshot, snapshot_id)
 
-        assert snapshot.id is not None
-        assert snapshot.province_id == province.id
+        assert snapshot.province_id == province_id
         assert snapshot.snapshot_type == "simulation"
         assert snapshot.granularity == "decade"
 
-    def test_province_snapshot_relationship(self, db_session: Session):
-        """Test relationship between province and snapshots."""
-        province = Province(name="Test Province", founded_astro_day=0)
-        snapshot = ProvinceSnapshot(
-            province=province,
-            astro_day=100,
-            population_total=20000,
-        )
-
-        db_session.add(province)
-        db_session.add(snapshot)
-        db_session.commit()
-
-        assert snapshot.province_id == province.id
-        assert snapshot in province.snapshots
-
 
 class TestSettlementSnapshotUpdates:
     """Tests for SettlementSnapshot updates (PR-003a)."""
 
-    def test_settlement_snapshot_with_type_and_granularity(self, db_session: Session):
+    def test_settlement_snapshot_with_type_and_granularity(
+        self, db_session: Session, bulk_add
+    ):
         """Test that SettlementSnapshot now has snapshot_type and granularity."""
-        settlement = Settlement(
-            name="Test Settlement",
-            settlement_type="hamlet",
-            founded_astro_day=0,
-        )
-        db_session.add(settlement)
-        db_session.flush()
+        settlement_id = db_session.execute(
+            INSERT_SETTLEMENT,
+            {
+                "name": "Test Settlement",
+                "settlement_type": "hamlet",
+                "founded_astro_day": 0,
+            },
+        ).scalar_one()
 
         snapshot = SettlementSnapshot(
-            settlement_id=settlement.id,
+            settlement_id=settlement_id,
             astro_day=100,
             population_total=1000,
             snapshot_type="census",
             granularity="year",
         )
 
-        db_session.add(snapshot)
-        db_session.commit()
+        bulk_add(snapshot)
 
         assert snapshot.snapshot_type == "census"
         assert snapshot.granularity == "year"
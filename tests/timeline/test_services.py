@@ -4,18 +4,12 @@ Tests for the timeline service layer.
 Tests CRUD operations and business logic for all service classes.
 """
 
+from collections import namedtuple
+from typing import Callable, Dict
+
 import pytest
 
-from app_timeline.models import (
-    Entity,
-    Epoch,
-    Event,
-    Province,
-    Region,
-    Route,
-    Settlement,
-    SettlementSnapshot,
-)
+from app_timeline.models import Epoch, Region, Settlement
 from app_timeline.services import (
     EntityService,
     EpochService,
@@ -27,6 +21,51 @@ from app_timeline.services import (
     SnapshotService,
 )
 
+BaseGeography = namedtuple("BaseGeography", ["region", "province"])
+
+
+@pytest.fixture
+def base_geography(test_db) -> BaseGeography:
+    """Create the region and province that settlement-level tests hang off."""
+    with RegionService() as region_service:
+        region = region_service.create_region(name="Test Region")
+
+    with ProvinceService() as province_service:
+        province = province_service.create_province(
+            name="Test Province", region_id=region.id
+        )
+
+    return BaseGeography(region, province)
+
+
+@pytest.fixture
+def settlement_factory(base_geography: BaseGeography) -> Callable[..., Settlement]:
+    """Return a helper that creates settlements in the base province."""
+
+    def make(name: str, **kwargs) -> Settlement:
+        kwargs.setdefault("settlement_type", "city")
+        with SettlementService() as service:
+            return service.create_settlement(
+                name=name, province_id=base_geography.province.id, **kwargs
+            )
+
+    return make
+
+
+@pytest.fixture
+def seeded_epochs(test_db) -> Dict[str, Epoch]:
+    """Seed three epochs (two overlapping, one apart), keyed by name."""
+    with EpochService() as service:
+        epochs = service.bulk_create(
+            [
+                {"name": "Epoch 1", "start_astro_day": 0, "end_astro_day": 100},
+                {"name": "Epoch 2", "start_astro_day": 50, "end_astro_day": 150},
+                {"name": "Epoch 3", "start_astro_day": 200, "end_astro_day": 300},
+            ]
+        )
+
+    return {epoch.name: epoch for epoch in epochs}
+
 
 class TestEpochService:
     """Tests for EpochService."""
@@ -67,62 +106,57 @@ class TestEpochService:
                     name="Test Epoch", start_astro_day=200, end_astro_day=300
                 )
 
-    def test_get_epochs_containing_day(self, db_session):
-        """Test finding epochs containing a specific day."""
+    def test_bulk_create_failure_rolls_back(self, db_session):
+        """Test that a failed bulk insert raises ValueError and keeps no rows."""
+        rows = [
+            {"name": name, "start_astro_day": day, "end_astro_day": day + 5}
+            for name, day in [
+                ("Bulk Epoch", 0),
+                ("Other Epoch", 10),
+                ("Bulk Epoch", 20),
+            ]
+        ]
         with EpochService() as service:
-            epoch1 = service.create_epoch(
-                name="Epoch 1", start_astro_day=0, end_astro_day=100
-            )
-            epoch2 = service.create_epoch(
-                name="Epoch 2", start_astro_day=50, end_astro_day=150
-            )
-            epoch3 = service.create_epoch(
-                name="Epoch 3", start_astro_day=200, end_astro_day=300
-            )
-
-            # Day 75 should be in epochs 1 and 2
-            epochs = service.get_epochs_containing_day(75)
-            assert len(epochs) == 2
-            assert epoch1 in epochs
-            assert epoch2 in epochs
-            assert epoch3 not in epochs
-
-    def test_get_overlapping_epochs(self, db_session):
-        """Test finding overlapping epochs."""
-        with EpochService() as service:
-            epoch1 = service.create_epoch(
-                name="Epoch 1", start_astro_day=0, end_astro_day=100
-            )
-            epoch2 = service.create_epoch(
-                name="Epoch 2", start_astro_day=50, end_astro_day=150
-            )
-            epoch3 = service.create_epoch(
-                name="Epoch 3", start_astro_day=200, end_astro_day=300
-            )
-
-            # Epoch 1 should overlap with epoch 2 only
-            overlapping = service.get_overlapping_epochs(epoch1.id)
-            assert len(overlapping) == 1
-            assert epoch2 in overlapping
-
-    def test_get_epochs_in_range(self, db_session):
-        """Test finding epochs in a time range."""
+            with pytest.raises(
+                ValueError, match="UNIQUE constraint failed: epochs.name"
+            ):
+                service.bulk_create(rows)
+
+            assert service.get_by_name("Bulk Epoch") is None
+            assert service.get_by_name("Other Epoch") is None
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            pytest.param(
+                lambda service, epochs: service.get_epochs_containing_day(75),
+                {"Epoch 1", "Epoch 2"},
+                id="containing_day",
+            ),
+            pytest.param(
+                lambda service, epochs: service.get_overlapping_epochs(
+                    epochs["Epoch 1"].id
+                ),
+                {"Epoch 2"},
+                id="overlapping",
+            ),
+            pytest.param(
+                lambda service, epochs: service.get_epochs_in_range(
+                    25, 125, fully_contained=False
+                ),
+                {"Epoch 1", "Epoch 2"},
+                id="in_range",
+            ),
+        ],
+    )
+    def test_epoch_queries(self, seeded_epochs, query, expected):
+        """Test the epoch time queries against the same three seeded epochs."""
         with EpochService() as service:
-            epoch1 = service.create_epoch(
-                name="Epoch 1", start_astro_day=0, end_astro_day=100
-            )
-            epoch2 = service.create_epoch(
-                name="Epoch 2", start_astro_day=50, end_astro_day=150
-            )
-            epoch3 = service.create_epoch(
-                name="Epoch 3", start_astro_day=200, end_astro_day=300
-            )
+            epochs = query(service, seeded_epochs)
 
-            # Query range 25-125 should overlap with epochs 1 and 2
-            epochs = service.get_epochs_in_range(25, 125, fully_contained=False)
-            assert len(epochs) == 2
-            assert epoch1 in epochs
-            assert epoch2 in epochs
+        assert {epoch.id for epoch in epochs} == {
+            seeded_epochs[name].id for name in expected
+        }
 
 
 class TestRegionService:
@@ -152,9 +186,16 @@ class TestRegionService:
             region2 = service.create_region(name="Region B")
 
             regions = service.get_active_regions()
-            assert len(regions) == 2
-            assert region1 in regions
-            assert region2 in regions
+            assert {r.id for r in regions} == {region1.id, region2.id}
+
+    def test_shared_session_left_open(self, db_session):
+        """Test that a service given a session does not close it."""
+        with RegionService() as owner:
+            with RegionService(session=owner.session) as service:
+                region = service.create_region(name="Shared Region")
+
+            assert service.session is owner.session
+            assert owner.session.get(Region, region.id) is region
 
 
 class TestProvinceService:
@@ -196,24 +237,15 @@ class TestProvinceService:
             prov2_id = prov2.id
 
             region1_provinces = service.get_provinces_by_region(region1_id)
-            assert len(region1_provinces) == 2
-            province_ids = [p.id for p in region1_provinces]
-            assert prov1_id in province_ids
-            assert prov2_id in province_ids
+            assert {p.id for p in region1_provinces} == {prov1_id, prov2_id}
 
 
 class TestSettlementService:
     """Tests for SettlementService."""
 
-    def test_create_settlement(self, db_session):
+    def test_create_settlement(self, base_geography):
         """Test creating a valid settlement."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
+        province = base_geography.province
 
         with SettlementService() as service:
             settlement = service.create_settlement(
@@ -231,91 +263,44 @@ class TestSettlementService:
             assert settlement.grid_y == 15
             assert settlement.area_sq_km == 100.5
 
-    def test_create_settlement_invalid_grid(self, db_session):
-        """Test that invalid grid coordinates are rejected."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
-
+    @pytest.mark.parametrize(
+        "field, value, message",
+        [
+            ("grid_x", 50, "grid_x must be between 1 and 40"),
+            ("grid_y", 35, "grid_y must be between 1 and 30"),
+        ],
+    )
+    def test_create_settlement_invalid_grid(
+        self, base_geography, field, value, message
+    ):
+        """Test that out-of-range grid coordinates are rejected."""
         with SettlementService() as service:
-            # grid_x out of range
-            with pytest.raises(ValueError, match="grid_x must be between 1 and 40"):
-                service.create_settlement(
-                    name="Invalid City",
-                    province_id=province.id,
-                    settlement_type="city",
-                    grid_x=50,
-                )
-
-            # grid_y out of range
-            with pytest.raises(ValueError, match="grid_y must be between 1 and 30"):
+            with pytest.raises(ValueError, match=message):
                 service.create_settlement(
                     name="Invalid City",
-                    province_id=province.id,
+                    province_id=base_geography.province.id,
                     settlement_type="city",
-                    grid_y=35,
+                    **{field: value},
                 )
 
-    def test_get_settlements_in_grid_area(self, db_session):
+    def test_get_settlements_in_grid_area(self, settlement_factory):
         """Test finding settlements in a grid area."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
+        settlement_factory("City A", grid_x=10, grid_y=10)
+        s2 = settlement_factory("City B", grid_x=20, grid_y=20)
+        settlement_factory("City C", grid_x=30, grid_y=30)
 
         with SettlementService() as service:
-            s1 = service.create_settlement(
-                name="City A",
-                province_id=province.id,
-                settlement_type="city",
-                grid_x=10,
-                grid_y=10,
-            )
-            s2 = service.create_settlement(
-                name="City B",
-                province_id=province.id,
-                settlement_type="city",
-                grid_x=20,
-                grid_y=20,
-            )
-            s3 = service.create_settlement(
-                name="City C",
-                province_id=province.id,
-                settlement_type="city",
-                grid_x=30,
-                grid_y=30,
-            )
-
             # Query area (15, 25, 15, 25) should only contain s2
             settlements = service.get_settlements_in_grid_area(15, 25, 15, 25)
-            assert len(settlements) == 1
-            assert s2 in settlements
+            assert {s.id for s in settlements} == {s2.id}
 
 
 class TestSnapshotService:
     """Tests for SnapshotService."""
 
-    def test_create_snapshot(self, db_session):
+    def test_create_snapshot(self, settlement_factory):
         """Test creating a valid settlement snapshot."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
-
-        with SettlementService() as settlement_service:
-            settlement = settlement_service.create_settlement(
-                name="Test City", province_id=province.id, settlement_type="city"
-            )
+        settlement = settlement_factory("Test City")
 
         with SnapshotService() as service:
             snapshot = service.create_snapshot(
@@ -329,20 +314,9 @@ class TestSnapshotService:
             assert snapshot.astro_day == 100
             assert snapshot.population_total == 5000
 
-    def test_create_snapshot_duplicate(self, db_session):
+    def test_create_snapshot_duplicate(self, settlement_factory):
         """Test that duplicate snapshots (same settlement + day) are rejected."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
-
-        with SettlementService() as settlement_service:
-            settlement = settlement_service.create_settlement(
-                name="Test City", province_id=province.id, settlement_type="city"
-            )
+        settlement = settlement_factory("Test City")
 
         with SnapshotService() as service:
             service.create_snapshot(
@@ -354,62 +328,34 @@ class TestSnapshotService:
                     settlement_id=settlement.id, astro_day=100, population_total=6000
                 )
 
-    def test_get_snapshots_in_range(self, db_session):
+    def test_get_snapshots_in_range(self, settlement_factory):
         """Test finding snapshots in a time range."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region.id
-            )
-
-        with SettlementService() as settlement_service:
-            settlement = settlement_service.create_settlement(
-                name="Test City", province_id=province.id, settlement_type="city"
-            )
+        settlement = settlement_factory("Test City")
 
         with SnapshotService() as service:
-            snap1 = service.create_snapshot(
-                settlement_id=settlement.id, astro_day=50, population_total=1000
-            )
-            snap2 = service.create_snapshot(
-                settlement_id=settlement.id, astro_day=100, population_total=2000
-            )
-            snap3 = service.create_snapshot(
-                settlement_id=settlement.id, astro_day=150, population_total=3000
+            snap1, snap2, snap3 = service.bulk_create(
+                [
+                    {
+                        "settlement_id": settlement.id,
+                        "astro_day": day,
+                        "population_total": population,
+                    }
+                    for day, population in [(50, 1000), (100, 2000), (150, 3000)]
+                ]
             )
 
             # Query range 75-125 should contain snap2 only
             snapshots = service.get_snapshots_in_range(settlement.id, 75, 125)
-            assert len(snapshots) == 1
-            assert snap2 in snapshots
+            assert {s.id for s in snapshots} == {snap2.id}
 
 
 class TestRouteService:
     """Tests for RouteService."""
 
-    def test_create_route(self, db_session):
+    def test_create_route(self, settlement_factory):
         """Test creating a valid route."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-            region_id = region.id
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region_id
-            )
-            province_id = province.id
-
-        with SettlementService() as settlement_service:
-            s1 = settlement_service.create_settlement(
-                name="City A", province_id=province_id, settlement_type="city"
-            )
-            s2 = settlement_service.create_settlement(
-                name="City B", province_id=province_id, settlement_type="city"
-            )
-            s1_id = s1.id
-            s2_id = s2.id
+        s1_id = settlement_factory("City A").id
+        s2_id = settlement_factory("City B").id
 
         with RouteService() as service:
             route = service.create_route(
@@ -422,23 +368,10 @@ class TestRouteService:
             assert route.id is not None
             assert route.distance_km == 50.0
 
-    def test_create_route_same_settlement(self, db_session):
+    def test_create_route_same_settlement(self, settlement_factory):
         """Test that routes must connect different settlements."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-            region_id = region.id
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region_id
-            )
-            province_id = province.id
-
-        with SettlementService() as settlement_service:
-            settlement = settlement_service.create_settlement(
-                name="City A", province_id=province_id, settlement_type="city"
-            )
-            settlement_id = settlement.id
+        settlement = settlement_factory("City A")
+        settlement_id = settlement.id
 
         with RouteService() as service:
             with pytest.raises(ValueError, match="two different settlements"):
@@ -448,27 +381,10 @@ class TestRouteService:
                     distance_km=10.0,
                 )
 
-    def test_get_route_between_settlements(self, db_session):
+    def test_get_route_between_settlements(self, settlement_factory):
         """Test finding route between two settlements."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-            region_id = region.id
-
-        with ProvinceService() as province_service:
-            province = province_service.create_province(
-                name="Test Province", region_id=region_id
-            )
-            province_id = province.id
-
-        with SettlementService() as settlement_service:
-            s1 = settlement_service.create_settlement(
-                name="City A", province_id=province_id, settlement_type="city"
-            )
-            s2 = settlement_service.create_settlement(
-                name="City B", province_id=province_id, settlement_type="city"
-            )
-            s1_id = s1.id
-            s2_id = s2.id
+        s1_id = settlement_factory("City A").id
+        s2_id = settlement_factory("City B").id
 
         with RouteService() as service:
             route = service.create_route(
@@ -518,30 +434,23 @@ class TestEntityService:
     def test_get_entities_alive_at_day(self, db_session):
         """Test finding entities alive at a specific day."""
         with EntityService() as service:
-            e1 = service.create_entity(
-                name="Entity 1",
-                entity_type="person",
-                founded_astro_day=0,
-                dissolved_astro_day=100,
-            )
-            e2 = service.create_entity(
-                name="Entity 2",
-                entity_type="person",
-                founded_astro_day=50,
-                dissolved_astro_day=150,
-            )
-            e3 = service.create_entity(
-                name="Entity 3",
-                entity_type="person",
-                founded_astro_day=200,
-                dissolved_astro_day=300,
+            e1, e2, e3 = service.bulk_create(
+                [
+                    {
+                        "name": f"Entity {i}",
+                        "entity_type": "person",
+                        "founded_astro_day": founded,
+                        "dissolved_astro_day": dissolved,
+                    }
+                    for i, (founded, dissolved) in enumerate(
+                        [(0, 100), (50, 150), (200, 300)], start=1
+                    )
+                ]
             )
 
             # Day 75 should have e1 and e2
             entities = service.get_entities_alive_at_day(75)
-            assert len(entities) == 2
-            assert e1 in entities
-            assert e2 in entities
+            assert {e.id for e in entities} == {e1.id, e2.id}
 
 
 class TestEventService:
@@ -610,20 +519,23 @@ class TestEventService:
             region_id = region.id
 
         with EventService() as service:
-            e1 = service.create_event(
-                title="Event 1", event_type="battle", astro_day=50, region_id=region_id
-            )
-            e2 = service.create_event(
-                title="Event 2", event_type="treaty", astro_day=100, region_id=region_id
-            )
-            e3 = service.create_event(
-                title="Event 3", event_type="founding", astro_day=150, region_id=region_id
+            e1, e2, e3 = service.bulk_create(
+                [
+                    {
+                        "title": f"Event {i}",
+                        "event_type": event_type,
+                        "astro_day": astro_day,
+                        "region_id": region_id,
+                    }
+                    for i, (event_type, astro_day) in enumerate(
+                        [("battle", 50), ("treaty", 100), ("founding", 150)], start=1
+                    )
+                ]
             )
 
             # Range 75-125 should contain e2 only
             events = service.get_events_in_range(75, 125)
-            assert len(events) == 1
-            assert e2 in events
+            assert {e.id for e in events} == {e2.id}
 
     def test_get_events_in_epoch(self, db_session):
         """Test finding events during an epoch."""
@@ -646,5 +558,10 @@ class TestEventService:
             )
 
             events = service.get_events_in_epoch(epoch.id)
-            assert len(events) == 1
-            assert e1 in events
+            assert {e.id for e in events} == {e1.id}
+
+    def test_get_events_in_epoch_missing_epoch(self, db_session):
+        """Test that an unknown epoch ID is rejected."""
+        with EventService() as service:
+            with pytest.raises(ValueError, match="does not exist"):
+                service.get_events_in_epoch(999)
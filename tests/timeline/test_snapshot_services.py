@@ -5,30 +5,63 @@ PR-003a: Tests for macro-scale demographic snapshot services including
 interpolation, validation, and temporal queries.
 """
 
+from typing import Generator
+
 import pytest
+from sqlalchemy import delete, event, insert
+from sqlalchemy.engine import Connection
 
 from app_timeline.models import Province, Region
-from app_timeline.services import (
-    ProvinceService,
-    ProvinceSnapshotService,
-    RegionService,
-    RegionSnapshotService,
-)
+from app_timeline.services import ProvinceSnapshotService, RegionSnapshotService
+
+
+@pytest.fixture(scope="class")
+def region_id(memory_connection: Connection) -> Generator[int, None, None]:
+    """
+    Insert the parent region once per test class.
+
+    Snapshots created by each test are rolled back; the region itself is
+    deleted when the class finishes.
+    """
+    with memory_connection.begin():
+        rid = memory_connection.execute(
+            insert(Region).returning(Region.id), {"name": "Test Region"}
+        ).scalar_one()
+
+    yield rid
+
+    with memory_connection.begin():
+        memory_connection.execute(delete(Region).where(Region.id == rid))
+
+
+@pytest.fixture(scope="class")
+def province_id(memory_connection: Connection) -> Generator[int, None, None]:
+    """
+    Insert the parent province once per test class.
+
+    Snapshots created by each test are rolled back; the province itself is
+    deleted when the class finishes.
+    """
+    with memory_connection.begin():
+        pid = memory_connection.execute(
+            insert(Province).returning(Province.id), {"name": "Test Province"}
+        ).scalar_one()
+
+    yield pid
+
+    with memory_connection.begin():
+        memory_connection.execute(delete(Province).where(Province.id == pid))
 
 
 class TestRegionSnapshotService:
     """Tests for RegionSnapshotService."""
 
-    def test_create_snapshot(self, db_session):
+    def test_create_snapshot(self, db_session, region_id):
         """Test creating a valid region snapshot."""
-        # Create region first
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         # Create snapshot
         with RegionSnapshotService() as service:
             snapshot = service.create_snapshot(
-                region_id=region.id,
+                region_id=region_id,
                 astro_day=100,
                 population_total=50000,
                 snapshot_type="census",
@@ -39,7 +72,7 @@ class TestRegionSnapshotService:
             )
 
             assert snapshot.id is not None
-            assert snapshot.region_id == region.id
+            assert snapshot.region_id == region_id
             assert snapshot.astro_day == 100
             assert snapshot.population_total == 50000
             assert snapshot.snapshot_type == "census"
@@ -57,41 +90,32 @@ class TestRegionSnapshotService:
                     population_total=50000,
                 )
 
-    def test_create_snapshot_negative_day(self, db_session):
+    def test_create_snapshot_negative_day(self, db_session, region_id):
         """Test that negative astro_day is rejected."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             with pytest.raises(ValueError, match="astro_day must be >= 0"):
                 service.create_snapshot(
-                    region_id=region.id,
+                    region_id=region_id,
                     astro_day=-1,
                     population_total=50000,
                 )
 
-    def test_create_snapshot_negative_population(self, db_session):
+    def test_create_snapshot_negative_population(self, db_session, region_id):
         """Test that negative population is rejected."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             with pytest.raises(ValueError, match="population_total must be >= 0"):
                 service.create_snapshot(
-                    region_id=region.id,
+                    region_id=region_id,
                     astro_day=100,
                     population_total=-1000,
                 )
 
-    def test_create_snapshot_duplicate(self, db_session):
+    def test_create_snapshot_duplicate(self, db_session, region_id):
         """Test that duplicate snapshots (same region + day) are rejected."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             # Create first snapshot
             service.create_snapshot(
-                region_id=region.id,
+                region_id=region_id,
                 astro_day=100,
                 population_total=50000,
             )
@@ -99,223 +123,299 @@ class TestRegionSnapshotService:
             # Attempt to create duplicate
             with pytest.raises(ValueError, match="already exists"):
                 service.create_snapshot(
-                    region_id=region.id,
+                    region_id=region_id,
                     astro_day=100,
                     population_total=60000,
                 )
 
-    def test_get_snapshots_for_region(self, db_session):
-        """Test retrieving all snapshots for a region."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
+    def test_bulk_create_snapshots_invalid_region(self, db_session):
+        """Test that bulk creation with invalid region ID fails."""
+        with RegionSnapshotService() as service:
+            with pytest.raises(ValueError, match="does not exist"):
+                service.bulk_create_snapshots(
+                    9999, [{"astro_day": 100, "population_total": 50000}]
+                )
 
+    def test_bulk_create_snapshots_duplicate(self, db_session, region_id):
+        """Test that bulk creation rejects repeated and existing days."""
         with RegionSnapshotService() as service:
-            snap1 = service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
-            )
-            snap2 = service.create_snapshot(
-                region_id=region.id, astro_day=200, population_total=60000
+            service.create_snapshot(
+                region_id=region_id, astro_day=100, population_total=50000
             )
-            snap3 = service.create_snapshot(
-                region_id=region.id, astro_day=300, population_total=70000
+
+            with pytest.raises(ValueError, match=r"already exists .* \[100, 200\]"):
+                service.bulk_create_snapshots(
+                    region_id,
+                    [
+                        {"astro_day": 100, "population_total": 60000},
+                        {"astro_day": 200, "population_total": 70000},
+                        {"astro_day": 200, "population_total": 80000},
+                    ],
+                )
+
+            assert len(service.get_snapshots_for_region(region_id)) == 1
+
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            ({"population_total": 50000}, "Row 1 missing astro_day"),
+            ({"astro_day": 200}, "Row 1 missing population_total"),
+        ],
+    )
+    def test_bulk_create_snapshots_missing_key(
+        self, db_session, region_id, row, message
+    ):
+        """Test that bulk creation rejects rows without required fields."""
+        with RegionSnapshotService() as service:
+            with pytest.raises(ValueError, match=message):
+                service.bulk_create_snapshots(
+                    region_id, [{"astro_day": 100, "population_total": 50000}, row]
+                )
+
+            assert service.get_snapshots_for_region(region_id) == []
+
+    def test_bulk_create_snapshots_rejects_parent_key(self, db_session, region_id):
+        """Test that a row cannot redirect its snapshot to another region."""
+        row = {"astro_day": 1, "population_total": 5, "region_id": 999}
+        with RegionSnapshotService() as service:
+            with pytest.raises(ValueError, match="Row 0 must not set region_id"):
+                service.bulk_create_snapshots(region_id, [row])
+
+            assert service.get_snapshots_for_region(999) == []
+
+    def test_rollback_forgets_confirmed_region(self, db_session):
+        """Test that a region undone by a rollback is checked again."""
+        region = Region(name="Transient Region")
+        db_session.add(region)
+        db_session.flush()
+
+        with RegionSnapshotService(session=db_session) as service:
+            # Confirms the region, then fails validation before writing
+            with pytest.raises(ValueError, match="population_total"):
+                service.create_snapshot(
+                    region_id=region.id, astro_day=1, population_total=-1
+                )
+
+            db_session.rollback()
+
+            with pytest.raises(ValueError, match="does not exist"):
+                service.create_snapshot(
+                    region_id=region.id, astro_day=1, population_total=5
+                )
+
+        # Closing the service unhooks it from the shared session
+        assert not event.contains(
+            db_session, "after_soft_rollback", service._forget_regions
+        )
+
+    def test_get_snapshots_for_region(self, db_session, region_id):
+        """Test retrieving all snapshots for a region."""
+        with RegionSnapshotService() as service:
+            service.bulk_create_snapshots(
+                region_id,
+                [
+                    {"astro_day": 300, "population_total": 70000},
+                    {"astro_day": 100, "population_total": 50000},
+                    {"astro_day": 200, "population_total": 60000},
+                ],
             )
 
-            snapshots = service.get_snapshots_for_region(region.id)
+            snapshots = service.get_snapshots_for_region(region_id)
 
             assert len(snapshots) == 3
             assert snapshots[0].astro_day == 100  # Ordered by day
             assert snapshots[1].astro_day == 200
             assert snapshots[2].astro_day == 300
 
-    def test_get_snapshots_for_region_filtered(self, db_session):
-        """Test retrieving filtered snapshots for a region."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
+    def test_get_snapshot_days_for_region(self, db_session, region_id):
+        """Test retrieving only the snapshot days for a region."""
         with RegionSnapshotService() as service:
-            service.create_snapshot(
-                region_id=region.id,
-                astro_day=100,
-                population_total=50000,
-                snapshot_type="census",
-                granularity="year",
-            )
-            service.create_snapshot(
-                region_id=region.id,
-                astro_day=200,
-                population_total=60000,
-                snapshot_type="simulation",
-                granularity="decade",
+            service.bulk_create_snapshots(
+                region_id,
+                [
+                    {"astro_day": 300, "population_total": 70000},
+                    {"astro_day": 100, "population_total": 50000},
+                    {"astro_day": 200, "population_total": 60000},
+                ],
             )
-            service.create_snapshot(
-                region_id=region.id,
-                astro_day=300,
-                population_total=70000,
-                snapshot_type="census",
-                granularity="year",
+
+            assert service.get_snapshot_days_for_region(region_id) == [100, 200, 300]
+            assert service.get_snapshot_days_for_region(
+                region_id, start_day=150, end_day=300
+            ) == [200, 300]
+            assert service.get_snapshot_days_for_region(region_id + 1) == []
+
+    def test_get_snapshots_for_region_filtered(self, db_session, region_id):
+        """Test retrieving filtered snapshots for a region."""
+        with RegionSnapshotService() as service:
+            service.bulk_create_snapshots(
+                region_id,
+                [
+                    {
+                        "astro_day": day,
+                        "population_total": population,
+                        "snapshot_type": snapshot_type,
+                        "granularity": granularity,
+                    }
+                    for day, population, snapshot_type, granularity in [
+                        (100, 50000, "census", "year"),
+                        (200, 60000, "simulation", "decade"),
+                        (300, 70000, "census", "year"),
+                    ]
+                ],
             )
 
             # Filter by day range
             snapshots = service.get_snapshots_for_region(
-                region.id, start_day=150, end_day=250
+                region_id, start_day=150, end_day=250
             )
             assert len(snapshots) == 1
             assert snapshots[0].astro_day == 200
 
             # Filter by snapshot type
             snapshots = service.get_snapshots_for_region(
-                region.id, snapshot_type="census"
+                region_id, snapshot_type="census"
             )
             assert len(snapshots) == 2
 
             # Filter by granularity
             snapshots = service.get_snapshots_for_region(
-                region.id, granularity="decade"
+                region_id, granularity="decade"
             )
             assert len(snapshots) == 1
 
-    def test_get_snapshot_at_day(self, db_session):
+    def test_get_snapshot_at_day(self, db_session, region_id):
         """Test retrieving exact snapshot at specific day."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
-            service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
-            )
-            service.create_snapshot(
-                region_id=region.id, astro_day=200, population_total=60000
+            service.bulk_create_snapshots(
+                region_id,
+                [
+                    {"astro_day": 100, "population_total": 50000},
+                    {"astro_day": 200, "population_total": 60000},
+                ],
             )
 
             # Exact match
-            snapshot = service.get_snapshot_at_day(region.id, 100)
+            snapshot = service.get_snapshot_at_day(region_id, 100)
             assert snapshot is not None
             assert snapshot.astro_day == 100
 
             # No match
-            snapshot = service.get_snapshot_at_day(region.id, 150)
+            snapshot = service.get_snapshot_at_day(region_id, 150)
             assert snapshot is None
 
-    def test_get_nearest_snapshot(self, db_session):
+    def test_get_nearest_snapshot(self, db_session, region_id):
         """Test finding nearest snapshot before/after a day."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
-            snap1 = service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
-            )
-            snap2 = service.create_snapshot(
-                region_id=region.id, astro_day=300, population_total=70000
+            snap1, snap2 = service.bulk_create_snapshots(
+                region_id,
+                [
+                    {"astro_day": 100, "population_total": 50000},
+                    {"astro_day": 300, "population_total": 70000},
+                ],
             )
 
             # Nearest before
-            nearest = service.get_nearest_snapshot(region.id, 200, before=True)
+            nearest = service.get_nearest_snapshot(region_id, 200, before=True)
             assert nearest.id == snap1.id
 
             # Nearest after
-            nearest = service.get_nearest_snapshot(region.id, 200, before=False)
+            nearest = service.get_nearest_snapshot(region_id, 200, before=False)
             assert nearest.id == snap2.id
 
             # Exact match (before)
-            nearest = service.get_nearest_snapshot(region.id, 100, before=True)
+            nearest = service.get_nearest_snapshot(region_id, 100, before=True)
             assert nearest.id == snap1.id
 
             # No snapshot before
-            nearest = service.get_nearest_snapshot(region.id, 50, before=True)
+            nearest = service.get_nearest_snapshot(region_id, 50, before=True)
             assert nearest is None
 
             # No snapshot after
-            nearest = service.get_nearest_snapshot(region.id, 400, before=False)
+            nearest = service.get_nearest_snapshot(region_id, 400, before=False)
             assert nearest is None
 
-    def test_get_interpolated_no_data(self, db_session):
+    def test_get_interpolated_no_data(self, db_session, region_id):
         """Test interpolation with no snapshots available."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
-            result = service.get_interpolated(region.id, 100)
+            result = service.get_interpolated(region_id, 100)
             assert result is None
 
-    def test_get_interpolated_exact_match(self, db_session):
+    def test_get_interpolated_exact_match(self, db_session, region_id):
         """Test interpolation returns exact snapshot when available."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             snapshot = service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
+                region_id=region_id, astro_day=100, population_total=50000
             )
 
-            result = service.get_interpolated(region.id, 100)
+            result = service.get_interpolated(region_id, 100)
 
             assert result is not None
             assert result["id"] == snapshot.id
             assert result["astro_day"] == 100
             assert result["population_total"] == 50000
 
-    def test_get_interpolated_before_first(self, db_session):
+    def test_get_interpolated_before_first(self, db_session, region_id):
         """Test interpolation before first snapshot returns first snapshot."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             snapshot = service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
+                region_id=region_id, astro_day=100, population_total=50000
             )
 
-            result = service.get_interpolated(region.id, 50)
+            result = service.get_interpolated(region_id, 50)
 
             assert result is not None
             assert result["id"] == snapshot.id
             assert result["astro_day"] == 100
 
-    def test_get_interpolated_after_last(self, db_session):
+    def test_get_interpolated_after_last(self, db_session, region_id):
         """Test interpolation after last snapshot returns last snapshot."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
             snapshot = service.create_snapshot(
-                region_id=region.id, astro_day=100, population_total=50000
+                region_id=region_id, astro_day=100, population_total=50000
             )
 
-            result = service.get_interpolated(region.id, 200)
+            result = service.get_interpolated(region_id, 200)
 
             assert result is not None
             assert result["id"] == snapshot.id
             assert result["astro_day"] == 100
 
-    def test_get_interpolated_linear(self, db_session):
+    def test_get_interpolated_linear(self, db_session, region_id):
         """Test linear interpolation between snapshots."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
-            snap1 = service.create_snapshot(
-                region_id=region.id,
-                astro_day=100,
-                population_total=50000,
-                population_by_species={"huum": 30000, "sint": 20000},
-                population_by_habitat={"on_ground": 45000, "under_ground": 5000},
-                cultural_composition={"language": "Fatuni"},
-                economic_data={"primary_industry": "agriculture"},
-                meta_data={"source": "census"},
-            )
-            snap2 = service.create_snapshot(
-                region_id=region.id,
-                astro_day=200,
-                population_total=70000,
-                population_by_species={"huum": 40000, "sint": 30000},
-                population_by_habitat={"on_ground": 60000, "under_ground": 10000},
-                cultural_composition={"language": "Mixed"},
-                economic_data={"primary_industry": "trade"},
-                meta_data={"source": "estimate"},
+            snap1, snap2 = service.bulk_create_snapshots(
+                region_id,
+                [
+                    {
+                        "astro_day": 100,
+                        "population_total": 50000,
+                        "population_by_species": {"huum": 30000, "sint": 20000},
+                        "population_by_habitat": {
+                            "on_ground": 45000,
+                            "under_ground": 5000,
+                        },
+                        "cultural_composition": {"language": "Fatuni"},
+                        "economic_data": {"primary_industry": "agriculture"},
+                        "meta_data": {"source": "census"},
+                    },
+                    {
+                        "astro_day": 200,
+                        "population_total": 70000,
+                        "population_by_species": {"huum": 40000, "sint": 30000},
+                        "population_by_habitat": {
+                            "on_ground": 60000,
+                            "under_ground": 10000,
+                        },
+                        "cultural_composition": {"language": "Mixed"},
+                        "economic_data": {"primary_industry": "trade"},
+                        "meta_data": {"source": "estimate"},
+                    },
+                ],
             )
 
             # Interpolate at midpoint (day 150)
-            result = service.get_interpolated(region.id, 150)
+            result = service.get_interpolated(region_id, 150)
 
             assert result is not None
             assert result["astro_day"] == 150
@@ -342,30 +442,28 @@ class TestRegionSnapshotService:
             assert result["interpolation_info"]["after_id"] == snap2.id
             assert result["interpolation_info"]["interpolation_factor"] == 0.5
 
-    def test_interpolate_dict_with_new_keys(self, db_session):
+    def test_interpolate_dict_with_new_keys(self, db_session, region_id):
         """Test dict interpolation handles keys appearing/disappearing."""
-        with RegionService() as region_service:
-            region = region_service.create_region(name="Test Region")
-
         with RegionSnapshotService() as service:
-            # First snapshot has only huum
-            service.create_snapshot(
-                region_id=region.id,
-                astro_day=100,
-                population_total=50000,
-                population_by_species={"huum": 50000},
-            )
-
-            # Second snapshot has both huum and sint
-            service.create_snapshot(
-                region_id=region.id,
-                astro_day=200,
-                population_total=70000,
-                population_by_species={"huum": 40000, "sint": 30000},
+            # First snapshot has only huum, second has both huum and sint
+            service.bulk_create_snapshots(
+                region_id,
+                [
+                    {
+                        "astro_day": 100,
+                        "population_total": 50000,
+                        "population_by_species": {"huum": 50000},
+                    },
+                    {
+                        "astro_day": 200,
+                        "population_total": 70000,
+                        "population_by_species": {"huum": 40000, "sint": 30000},
+                    },
+                ],
             )
 
             # Interpolate at midpoint
-            result = service.get_interpolated(region.id, 150)
+            result = service.get_interpolated(region_id, 150)
 
             # huum should interpolate from 50000 to 40000
             assert result["population_by_species"]["huum"] == 45000
@@ -377,16 +475,12 @@ class TestRegionSnapshotService:
 class TestProvinceSnapshotService:
     """Tests for ProvinceSnapshotService."""
 
-    def test_create_snapshot(self, db_session):
+    def test_create_snapshot(self, db_session, province_id):
         """Test creating a valid province snapshot."""
-        # Create province first
-        with ProvinceService() as province_service:
-            province = province_service.create_province(name="Test Province")
-
         # Create snapshot
         with ProvinceSnapshotService() as service:
             snapshot = service.create_snapshot(
-                province_id=province.id,
+                province_id=province_id,
                 astro_day=100,
                 population_total=20000,
                 snapshot_type="simulation",
@@ -394,7 +488,7 @@ class TestProvinceSnapshotService:
             )
 
             assert snapshot.id is not None
-            assert snapshot.province_id == province.id
+            assert snapshot.province_id == province_id
             assert snapshot.astro_day == 100
             assert snapshot.population_total == 20000
             assert snapshot.snapshot_type == "simulation"
@@ -410,65 +504,96 @@ class TestProvinceSnapshotService:
                     population_total=20000,
                 )
 
-    def test_create_snapshot_duplicate(self, db_session):
+    def test_create_snapshot_duplicate(self, db_session, province_id):
         """Test that duplicate snapshots are rejected."""
-        with ProvinceService() as province_service:
-            province = province_service.create_province(name="Test Province")
-
         with ProvinceSnapshotService() as service:
             service.create_snapshot(
-                province_id=province.id,
+                province_id=province_id,
                 astro_day=100,
                 population_total=20000,
             )
 
             with pytest.raises(ValueError, match="already exists"):
                 service.create_snapshot(
-                    province_id=province.id,
+                    province_id=province_id,
                     astro_day=100,
                     population_total=25000,
                 )
 
-    def test_get_snapshots_for_province(self, db_session):
-        """Test retrieving all snapshots for a province."""
-        with ProvinceService() as province_service:
-            province = province_service.create_province(name="Test Province")
+    def test_bulk_create_snapshots_missing_key(self, db_session, province_id):
+        """Test that bulk creation rejects rows without required fields."""
+        with ProvinceSnapshotService() as service:
+            with pytest.raises(ValueError, match="Row 0 missing population_total"):
+                service.bulk_create_snapshots(province_id, [{"astro_day": 100}])
 
+    def test_bulk_create_snapshots_rejects_parent_key(self, db_session, province_id):
+        """Test that a row cannot redirect its snapshot to another province."""
+        row = {"astro_day": 1, "population_total": 5, "province_id": 999}
         with ProvinceSnapshotService() as service:
-            service.create_snapshot(
-                province_id=province.id, astro_day=100, population_total=20000
-            )
-            service.create_snapshot(
-                province_id=province.id, astro_day=200, population_total=25000
+            with pytest.raises(ValueError, match="Row 0 must not set province_id"):
+                service.bulk_create_snapshots(province_id, [row])
+
+            assert service.get_snapshots_for_province(999) == []
+
+    def test_rollback_forgets_confirmed_province(self, db_session):
+        """Test that a province undone by a rollback is checked again."""
+        province = Province(name="Transient Province")
+        db_session.add(province)
+        db_session.flush()
+
+        with ProvinceSnapshotService(session=db_session) as service:
+            # Confirms the province, then fails validation before writing
+            with pytest.raises(ValueError, match="population_total"):
+                service.create_snapshot(
+                    province_id=province.id, astro_day=1, population_total=-1
+                )
+
+            db_session.rollback()
+
+            with pytest.raises(ValueError, match="does not exist"):
+                service.create_snapshot(
+                    province_id=province.id, astro_day=1, population_total=5
+                )
+
+    def test_get_snapshots_for_province(self, db_session, province_id):
+        """Test retrieving all snapshots for a province."""
+        with ProvinceSnapshotService() as service:
+            service.bulk_create_snapshots(
+                province_id,
+                [
+                    {"astro_day": 100, "population_total": 20000},
+                    {"astro_day": 200, "population_total": 25000},
+                ],
             )
 
-            snapshots = service.get_snapshots_for_province(province.id)
+            snapshots = service.get_snapshots_for_province(province_id)
 
             assert len(snapshots) == 2
             assert snapshots[0].astro_day == 100
             assert snapshots[1].astro_day == 200
+            assert service.get_snapshot_days_for_province(province_id) == [100, 200]
 
-    def test_interpolation_matches_region_pattern(self, db_session):
+    def test_interpolation_matches_region_pattern(self, db_session, province_id):
         """Test that province interpolation follows same pattern as region."""
-        with ProvinceService() as province_service:
-            province = province_service.create_province(name="Test Province")
-
         with ProvinceSnapshotService() as service:
-            service.create_snapshot(
-                province_id=province.id,
-                astro_day=100,
-                population_total=20000,
-                population_by_species={"huum": 15000, "sint": 5000},
-            )
-            service.create_snapshot(
-                province_id=province.id,
-                astro_day=300,
-                population_total=40000,
-                population_by_species={"huum": 25000, "sint": 15000},
+            service.bulk_create_snapshots(
+                province_id,
+                [
+                    {
+                        "astro_day": 100,
+                        "population_total": 20000,
+                        "population_by_species": {"huum": 15000, "sint": 5000},
+                    },
+                    {
+                        "astro_day": 300,
+                        "population_total": 40000,
+                        "population_by_species": {"huum": 25000, "sint": 15000},
+                    },
+                ],
             )
 
             # Interpolate at midpoint
-            result = service.get_interpolated(province.id, 200)
+            result = service.get_interpolated(province_id, 200)
 
             assert result is not None
             assert result["population_total"] == 30000
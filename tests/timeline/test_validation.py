@@ -6,6 +6,8 @@ Tests for validation utility functions.
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from app_timeline.utils import (
@@ -33,86 +35,80 @@ from app_timeline.utils import (
 class TestValidateDateRange:
     """Tests for validate_date_range function."""
 
-    def test_valid_date_range(self):
+    @pytest.mark.parametrize(
+        "start_day, end_day",
+        [(0, 100), (0, 1), (100, 1000), (10**9, 10**9 + 1), (0, sys.maxsize)],
+    )
+    def test_valid_date_range(self, start_day, end_day):
         """Test that valid date ranges pass."""
-        validate_date_range(0, 100)
-        validate_date_range(0, 1)
-        validate_date_range(100, 1000)
+        validate_date_range(start_day, end_day)
 
     def test_equal_dates_with_allow_equal(self):
         """Test that equal dates pass when allow_equal=True."""
         validate_date_range(100, 100, allow_equal=True)
         validate_date_range(0, 0, allow_equal=True)
 
-    def test_equal_dates_without_allow_equal(self):
-        """Test that equal dates fail when allow_equal=False."""
-        with pytest.raises(ValueError, match="must be <"):
-            validate_date_range(100, 100, allow_equal=False)
-
-    def test_inverted_date_range(self):
-        """Test that inverted ranges fail."""
-        with pytest.raises(ValueError, match="must be"):
-            validate_date_range(100, 50)
-
-    def test_negative_start_day(self):
-        """Test that negative start day fails."""
-        with pytest.raises(ValueError, match="Start day cannot be negative"):
-            validate_date_range(-1, 100)
-
-    def test_negative_end_day(self):
-        """Test that negative end day fails."""
-        with pytest.raises(ValueError, match="End day cannot be negative"):
-            validate_date_range(0, -1)
-
-    def test_both_negative(self):
-        """Test that both negative days fail."""
-        with pytest.raises(ValueError, match="cannot be negative"):
-            validate_date_range(-10, -5)
+    @pytest.mark.parametrize(
+        "start_day, end_day, message",
+        [
+            (100, 100, "must be <"),
+            (100, 50, "must be"),
+            (-1, 100, "Start day cannot be negative"),
+            (0, -1, "End day cannot be negative"),
+            (-10, -5, "cannot be negative"),
+        ],
+        ids=["equal", "inverted", "negative_start", "negative_end", "both_negative"],
+    )
+    def test_invalid_date_range(self, start_day, end_day, message):
+        """Test that equal, inverted and negative ranges fail."""
+        with pytest.raises(ValueError, match=message):
+            validate_date_range(start_day, end_day)
 
 
 class TestValidateGridCoordinates:
     """Tests for validate_grid_coordinates function."""
 
-    def test_valid_coordinates(self):
-        """Test that valid coordinates pass."""
-        validate_grid_coordinates(1, 1)
-        validate_grid_coordinates(20, 15)
-        validate_grid_coordinates(GRID_X_MAX, GRID_Y_MAX)
-        validate_grid_coordinates(GRID_X_MIN, GRID_Y_MIN)
-
-    def test_x_too_small(self):
-        """Test that x < GRID_X_MIN fails."""
-        with pytest.raises(ValueError, match="grid_x must be between"):
-            validate_grid_coordinates(0, 15)
-
-    def test_x_too_large(self):
-        """Test that x > GRID_X_MAX fails."""
-        with pytest.raises(ValueError, match="grid_x must be between"):
-            validate_grid_coordinates(GRID_X_MAX + 1, 15)
-
-    def test_y_too_small(self):
-        """Test that y < GRID_Y_MIN fails."""
-        with pytest.raises(ValueError, match="grid_y must be between"):
-            validate_grid_coordinates(20, 0)
-
-    def test_y_too_large(self):
-        """Test that y > GRID_Y_MAX fails."""
-        with pytest.raises(ValueError, match="grid_y must be between"):
-            validate_grid_coordinates(20, GRID_Y_MAX + 1)
-
-    def test_both_invalid(self):
-        """Test that both invalid coordinates fail."""
-        with pytest.raises(ValueError):
-            validate_grid_coordinates(0, 0)
+    @pytest.mark.parametrize(
+        "x, y",
+        [
+            (20, 15),
+            (GRID_X_MIN, GRID_Y_MIN),
+            (GRID_X_MIN, GRID_Y_MAX),
+            (GRID_X_MAX, GRID_Y_MIN),
+            (GRID_X_MAX, GRID_Y_MAX),
+            (None, GRID_Y_MAX),
+            (GRID_X_MAX, None),
+            (None, None),
+        ],
+    )
+    def test_valid_coordinates(self, x, y):
+        """Test that coordinates on or inside the grid bounds pass."""
+        validate_grid_coordinates(x, y)
+
+    @pytest.mark.parametrize(
+        "x, y, message",
+        [
+            (GRID_X_MIN - 1, 15, "grid_x must be between"),
+            (GRID_X_MAX + 1, 15, "grid_x must be between"),
+            (20, GRID_Y_MIN - 1, "grid_y must be between"),
+            (20, GRID_Y_MAX + 1, "grid_y must be between"),
+            (GRID_X_MIN - 1, GRID_Y_MIN - 1, "grid_x must be between"),
+        ],
+        ids=["x_too_small", "x_too_large", "y_too_small", "y_too_large", "both"],
+    )
+    def test_out_of_range(self, x, y, message):
+        """Test that coordinates outside the grid bounds fail."""
+        with pytest.raises(ValueError, match=message):
+            validate_grid_coordinates(x, y)
 
 
 class TestValidateSettlementType:
     """Tests for validate_settlement_type function."""
 
-    def test_valid_settlement_types(self):
-        """Test that all valid settlement types pass."""
-        for settlement_type in VALID_SETTLEMENT_TYPES:
-            validate_settlement_type(settlement_type)
+    @pytest.mark.parametrize("settlement_type", VALID_SETTLEMENT_TYPES)
+    def test_valid_settlement_types(self, settlement_type):
+        """Test that each valid settlement type passes."""
+        validate_settlement_type(settlement_type)
 
     def test_invalid_settlement_type(self):
         """Test that invalid settlement type fails."""
@@ -128,10 +124,10 @@ class TestValidateSettlementType:
 class TestValidateEntityType:
     """Tests for validate_entity_type function."""
 
-    def test_valid_entity_types(self):
-        """Test that all valid entity types pass."""
-        for entity_type in VALID_ENTITY_TYPES:
-            validate_entity_type(entity_type)
+    @pytest.mark.parametrize("entity_type", VALID_ENTITY_TYPES)
+    def test_valid_entity_types(self, entity_type):
+        """Test that each valid entity type passes."""
+        validate_entity_type(entity_type)
 
     def test_invalid_entity_type(self):
         """Test that invalid entity type fails."""
@@ -142,10 +138,10 @@ class TestValidateEntityType:
 class TestValidateEventType:
     """Tests for validate_event_type function."""
 
-    def test_valid_event_types(self):
-        """Test that all valid event types pass."""
-        for event_type in VALID_EVENT_TYPES:
-            validate_event_type(event_type)
+    @pytest.mark.parametrize("event_type", VALID_EVENT_TYPES)
+    def test_valid_event_types(self, event_type):
+        """Test that each valid event type passes."""
+        validate_event_type(event_type)
 
     def test_invalid_event_type(self):
         """Test that invalid event type fails."""
@@ -156,10 +152,10 @@ class TestValidateEventType:
 class TestValidateRouteType:
     """Tests for validate_route_type function."""
 
-    def test_valid_route_types(self):
-        """Test that all valid route types pass."""
-        for route_type in VALID_ROUTE_TYPES:
-            validate_route_type(route_type)
+    @pytest.mark.parametrize("route_type", VALID_ROUTE_TYPES)
+    def test_valid_route_types(self, route_type):
+        """Test that each valid route type passes."""
+        validate_route_type(route_type)
 
     def test_invalid_route_type(self):
         """Test that invalid route type fails."""
@@ -170,10 +166,10 @@ class TestValidateRouteType:
 class TestValidateRouteDifficulty:
     """Tests for validate_route_difficulty function."""
 
-    def test_valid_route_difficulties(self):
-        """Test that all valid route difficulties pass."""
-        for difficulty in VALID_ROUTE_DIFFICULTIES:
-            validate_route_difficulty(difficulty)
+    @pytest.mark.parametrize("difficulty", VALID_ROUTE_DIFFICULTIES)
+    def test_valid_route_difficulties(self, difficulty):
+        """Test that each valid route difficulty passes."""
+        validate_route_difficulty(difficulty)
 
     def test_invalid_route_difficulty(self):
         """Test that invalid route difficulty fails."""
@@ -184,99 +180,66 @@ class TestValidateRouteDifficulty:
 class TestValidatePositive:
     """Tests for validate_positive function."""
 
-    def test_positive_integer(self):
-        """Test that positive integers pass."""
-        validate_positive(1, "test_value")
-        validate_positive(100, "test_value")
-
-    def test_positive_float(self):
-        """Test that positive floats pass."""
-        validate_positive(0.1, "test_value")
-        validate_positive(99.9, "test_value")
-
-    def test_zero(self):
-        """Test that zero fails."""
-        with pytest.raises(ValueError, match="test_value must be positive"):
-            validate_positive(0, "test_value")
+    @pytest.mark.parametrize("value", [1, 100, 0.1, 99.9])
+    def test_positive_values(self, value):
+        """Test that positive integers and floats pass."""
+        validate_positive(value, "test_value")
 
-    def test_negative(self):
-        """Test that negative values fail."""
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_non_positive_values(self, value):
+        """Test that zero and negative values fail."""
         with pytest.raises(ValueError, match="test_value must be positive"):
-            validate_positive(-1, "test_value")
+            validate_positive(value, "test_value")
 
 
 class TestValidateNonNegative:
     """Tests for validate_non_negative function."""
 
-    def test_positive_integer(self):
-        """Test that positive integers pass."""
-        validate_non_negative(1, "test_value")
-        validate_non_negative(100, "test_value")
-
-    def test_positive_float(self):
-        """Test that positive floats pass."""
-        validate_non_negative(0.1, "test_value")
-        validate_non_negative(99.9, "test_value")
+    @pytest.mark.parametrize("value", [1, 100, 0.1, 99.9, 0, 0.0])
+    def test_non_negative_values(self, value):
+        """Test that positive values and zero pass."""
+        validate_non_negative(value, "test_value")
 
-    def test_zero(self):
-        """Test that zero passes."""
-        validate_non_negative(0, "test_value")
-        validate_non_negative(0.0, "test_value")
-
-    def test_negative(self):
+    @pytest.mark.parametrize("value", [-1, -0.1])
+    def test_negative_values(self, value):
         """Test that negative values fail."""
         with pytest.raises(ValueError, match="test_value must be non-negative"):
-            validate_non_negative(-1, "test_value")
-        with pytest.raises(ValueError, match="test_value must be non-negative"):
-            validate_non_negative(-0.1, "test_value")
+            validate_non_negative(value, "test_value")
 
 
 class TestValidationConstants:
     """Tests for validation constants."""
 
-    def test_settlement_types_list(self):
-        """Test that VALID_SETTLEMENT_TYPES contains expected types."""
-        assert "city" in VALID_SETTLEMENT_TYPES
-        assert "town" in VALID_SETTLEMENT_TYPES
-        assert "village" in VALID_SETTLEMENT_TYPES
-        assert "hamlet" in VALID_SETTLEMENT_TYPES
-        assert "outpost" in VALID_SETTLEMENT_TYPES
-
-    def test_entity_types_list(self):
-        """Test that VALID_ENTITY_TYPES contains expected types."""
-        assert "person" in VALID_ENTITY_TYPES
-        assert "organization" in VALID_ENTITY_TYPES
-        assert "faction" in VALID_ENTITY_TYPES
-        assert "dynasty" in VALID_ENTITY_TYPES
-        assert "guild" in VALID_ENTITY_TYPES
-
-    def test_event_types_list(self):
-        """Test that VALID_EVENT_TYPES contains expected types."""
-        assert "founding" in VALID_EVENT_TYPES
-        assert "battle" in VALID_EVENT_TYPES
-        assert "treaty" in VALID_EVENT_TYPES
-        assert "disaster" in VALID_EVENT_TYPES
-        assert "migration" in VALID_EVENT_TYPES
-
-    def test_route_types_list(self):
-        """Test that VALID_ROUTE_TYPES contains expected types."""
-        assert "road" in VALID_ROUTE_TYPES
-        assert "trail" in VALID_ROUTE_TYPES
-        assert "river" in VALID_ROUTE_TYPES
-        assert "sea" in VALID_ROUTE_TYPES
-
-    def test_route_difficulties_list(self):
-        """Test that VALID_ROUTE_DIFFICULTIES contains expected difficulties."""
-        assert "easy" in VALID_ROUTE_DIFFICULTIES
-        assert "moderate" in VALID_ROUTE_DIFFICULTIES
-        assert "hard" in VALID_ROUTE_DIFFICULTIES
-        assert "extreme" in VALID_ROUTE_DIFFICULTIES
+    @pytest.mark.parametrize(
+        "constant, expected",
+        [
+            (
+                VALID_SETTLEMENT_TYPES,
+                {"city", "town", "village", "hamlet", "outpost"},
+            ),
+            (
+                VALID_ENTITY_TYPES,
+                {"person", "organization", "faction", "dynasty", "guild"},
+            ),
+            (
+                VALID_EVENT_TYPES,
+                {"founding", "battle", "treaty", "disaster", "migration"},
+            ),
+            (VALID_ROUTE_TYPES, {"road", "trail", "river", "sea"}),
+            (VALID_ROUTE_DIFFICULTIES, {"easy", "moderate", "hard", "extreme"}),
+        ],
+        ids=[
+            "settlement_types",
+            "entity_types",
+            "event_types",
+            "route_types",
+            "route_difficulties",
+        ],
+    )
+    def test_contains_expected_values(self, constant, expected):
+        """Test that each VALID_* constant contains the expected values."""
+        assert expected <= set(constant)
 
     def test_grid_bounds(self):
         """Test that grid bounds are sensible."""
-        assert GRID_X_MIN == 1
-        assert GRID_X_MAX == 40
-        assert GRID_Y_MIN == 1
-        assert GRID_Y_MAX == 30
-        assert GRID_X_MIN < GRID_X_MAX
-        assert GRID_Y_MIN < GRID_Y_MAX
+        assert (GRID_X_MIN, GRID_X_MAX, GRID_Y_MIN, GRID_Y_MAX) == (1, 40, 1, 30)